@@ -0,0 +1,58 @@
+"""FastAPI dependency providers for the shared service singletons.
+
+Declared async so FastAPI resolves them inline on the event loop instead
+of dispatching each lookup to its threadpool, and cached per request.
+Tests can swap any of them via ``app.dependency_overrides``.
+"""
+
+from typing import Annotated, Optional
+
+from fastapi import Depends, Query
+
+from .services.inference import InferenceService, get_inference_service
+from .services.jobs import JobManager, get_job_manager
+from .services.i2v_jobs import I2VJobManager, get_i2v_job_manager
+from .services.lora_manager import LoRAManager, get_lora_manager
+from .services.hf_downloads import HFDownloadTracker, get_hf_download_tracker
+
+
+async def inference_service() -> InferenceService:
+    return get_inference_service()
+
+
+async def job_manager() -> JobManager:
+    return get_job_manager()
+
+
+async def i2v_job_manager() -> I2VJobManager:
+    return get_i2v_job_manager()
+
+
+async def lora_manager() -> LoRAManager:
+    return get_lora_manager()
+
+
+async def hf_download_tracker() -> HFDownloadTracker:
+    return get_hf_download_tracker()
+
+
+async def job_list_query(
+    session_id: Optional[str] = None,
+    active_only: bool = False,
+    limit: Optional[int] = Query(default=None, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
+) -> dict:
+    """Query parameters shared by the job list endpoints, as list_jobs() kwargs.
+
+    limit stays unbounded by default: the frontend fetches a session's (or
+    all bulk) jobs in one request and doesn't page.
+    """
+    return {"session_id": session_id, "active_only": active_only, "limit": limit, "offset": offset}
+
+
+InferenceServiceDep = Annotated[InferenceService, Depends(inference_service)]
+JobManagerDep = Annotated[JobManager, Depends(job_manager)]
+I2VJobManagerDep = Annotated[I2VJobManager, Depends(i2v_job_manager)]
+LoRAManagerDep = Annotated[LoRAManager, Depends(lora_manager)]
+HFDownloadTrackerDep = Annotated[HFDownloadTracker, Depends(hf_download_tracker)]
+JobListQuery = Annotated[dict, Depends(job_list_query)]
@@ -1,10 +1,17 @@
+import asyncio
+import os
+import sys
 import yaml
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 
+from .utils.cpu_affinity import api_cores, pin_current_thread
 from .routers import generate, assets, providers, settings, civitai, video, i2v, upscale, system, bulk, comfyui
 
 
@@ -16,10 +23,30 @@ def load_config() -> dict:
 
 config = load_config()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Size the default executor behind asyncio.to_thread, which carries
+    # blocking generation and file work off the event loop
+    executor = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 2))
+    asyncio.get_running_loop().set_default_executor(executor)
+    log_writer = asyncio.create_task(settings.run_log_writer())
+    # Optional: confine the event loop (and threads it spawns) to
+    # HOLLYWOOL_UVICORN_CORES, leaving the other cores to inference
+    pin_current_thread(api_cores())
+    yield
+    log_writer.cancel()
+    with suppress(asyncio.CancelledError):
+        await log_writer
+    await providers.close_http_client()
+    executor.shutdown(wait=False)
+
+
 app = FastAPI(
     title="HollyWool",
     description="Local AI image generation API",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS configuration
@@ -31,6 +58,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+class APIGZipMiddleware(GZipMiddleware):
+    """GZip only /api responses; media served from /outputs is already compressed.
+
+    Streaming (NDJSON) endpoints are skipped so each line is flushed immediately.
+    """
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "")
+        if scope["type"] == "http" and path.startswith("/api") and not path.endswith("/stream"):
+            await super().__call__(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
+# Compress large JSON payloads (job lists, workflows, object_info)
+app.add_middleware(APIGZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Mount outputs directory for serving generated images
 outputs_dir = Path(__file__).parent.parent.parent / "outputs"
 outputs_dir.mkdir(parents=True, exist_ok=True)
@@ -67,4 +112,6 @@ if __name__ == "__main__":
         host=config["server"]["host"],
         port=config["server"]["port"],
         reload=True,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
     )
@@ -9,7 +9,9 @@ from fastapi.responses import FileResponse
 from pydantic import BaseModel, ValidationError
 
 from ..models.schemas import AssetMetadata, AssetListResponse, VideoAssetMetadata, VideoAssetListResponse
+from ..services.asset_index import get_asset_index, ASSET_KIND_IMAGE, ASSET_KIND_VIDEO
 from ..utils.paths import get_output_dir, get_data_dir
+from ..utils.json_io import write_json
 
 router = APIRouter(prefix="/api", tags=["assets"])
 logger = logging.getLogger(__name__)
@@ -69,8 +71,28 @@ def load_sessions() -> SessionsData:
 def save_sessions(data: SessionsData) -> None:
     """Save sessions to file."""
     sessions_file = get_sessions_file()
-    with open(sessions_file, "w") as f:
-        json.dump(data.model_dump(), f, indent=2)
+    write_json(sessions_file, data.model_dump())
+
+
+def _with_file_info(data: dict) -> dict:
+    """Add the URL, parsed created_at and on-disk file info to raw sidecar metadata."""
+    data["url"] = f"/outputs/{data['filename']}"
+    data["created_at"] = datetime.fromisoformat(data["created_at"])
+
+    # Get file info from the actual media file
+    media_path = get_output_dir() / data["filename"]
+    if media_path.exists():
+        data["file_size"] = media_path.stat().st_size
+        data["file_path"] = str(media_path.resolve())
+    return data
+
+
+def _asset_from_metadata(data: dict) -> AssetMetadata:
+    return AssetMetadata(**_with_file_info(data))
+
+
+def _video_asset_from_metadata(data: dict) -> VideoAssetMetadata:
+    return VideoAssetMetadata(**_with_file_info(data))
 
 
 def load_asset_metadata(metadata_path: Path) -> Optional[AssetMetadata]:
@@ -81,17 +103,7 @@ def load_asset_metadata(metadata_path: Path) -> Optional[AssetMetadata]:
             # Skip video assets in image metadata loader
             if data.get("type") == "video":
                 return None
-            data["url"] = f"/outputs/{data['filename']}"
-            data["created_at"] = datetime.fromisoformat(data["created_at"])
-
-            # Get file info from the actual image file
-            output_dir = get_output_dir()
-            image_path = output_dir / data["filename"]
-            if image_path.exists():
-                data["file_size"] = image_path.stat().st_size
-                data["file_path"] = str(image_path.resolve())
-
-            return AssetMetadata(**data)
+            return _asset_from_metadata(data)
     except json.JSONDecodeError as e:
         logger.warning(f"Failed to parse asset metadata {metadata_path}: {e}")
     except KeyError as e:
@@ -109,26 +121,12 @@ async def list_assets(
     offset: int = Query(default=0, ge=0),
     model: Optional[str] = Query(default=None),
 ):
-    output_dir = get_output_dir()
-
-    # Get all metadata files sorted by modification time (newest first)
-    metadata_files = sorted(
-        output_dir.glob("*.json"),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
-    )
-
-    assets = []
-    for metadata_path in metadata_files:
-        asset = load_asset_metadata(metadata_path)
-        if asset:
-            # Filter by model if specified
-            if model and asset.model != model:
-                continue
-            assets.append(asset)
-
-    total = len(assets)
-    assets = assets[offset : offset + limit]
+    # Newest first (by sidecar mtime), paginated in SQLite; only new or
+    # changed sidecars are parsed
+    index = get_asset_index()
+    index.sync(get_output_dir())
+    rows, total = index.page(ASSET_KIND_IMAGE, limit, offset, model=model)
+    assets = [_asset_from_metadata(data) for data in rows]
 
     return AssetListResponse(assets=assets, total=total)
 
@@ -179,6 +177,7 @@ async def delete_asset(asset_id: str):
         image_path.unlink()
     if metadata_path.exists():
         metadata_path.unlink()
+    get_asset_index().remove(asset_id)
 
     return {"status": "deleted", "id": asset_id}
 
@@ -238,8 +237,7 @@ def load_video_sessions() -> VideoSessionsData:
 def save_video_sessions(data: VideoSessionsData) -> None:
     """Save video sessions to file."""
     sessions_file = get_video_sessions_file()
-    with open(sessions_file, "w") as f:
-        json.dump(data.model_dump(), f, indent=2)
+    write_json(sessions_file, data.model_dump())
 
 
 # Video session endpoints
@@ -265,17 +263,7 @@ def load_video_asset_metadata(metadata_path: Path) -> Optional[VideoAssetMetadat
             # Only load video assets
             if data.get("type") != "video":
                 return None
-            data["url"] = f"/outputs/{data['filename']}"
-            data["created_at"] = datetime.fromisoformat(data["created_at"])
-
-            # Get file info from the actual video file
-            output_dir = get_output_dir()
-            video_path = output_dir / data["filename"]
-            if video_path.exists():
-                data["file_size"] = video_path.stat().st_size
-                data["file_path"] = str(video_path.resolve())
-
-            return VideoAssetMetadata(**data)
+            return _video_asset_from_metadata(data)
     except json.JSONDecodeError as e:
         logger.warning(f"Failed to parse video metadata {metadata_path}: {e}")
     except KeyError as e:
@@ -294,26 +282,12 @@ async def list_video_assets(
     model: Optional[str] = Query(default=None),
 ):
     """List all video assets in the gallery."""
-    output_dir = get_output_dir()
-
-    # Get all metadata files sorted by modification time (newest first)
-    metadata_files = sorted(
-        output_dir.glob("*.json"),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
-    )
-
-    assets = []
-    for metadata_path in metadata_files:
-        asset = load_video_asset_metadata(metadata_path)
-        if asset:
-            # Filter by model if specified
-            if model and asset.model != model:
-                continue
-            assets.append(asset)
-
-    total = len(assets)
-    assets = assets[offset : offset + limit]
+    # Newest first (by sidecar mtime), paginated in SQLite; only new or
+    # changed sidecars are parsed
+    index = get_asset_index()
+    index.sync(get_output_dir())
+    rows, total = index.page(ASSET_KIND_VIDEO, limit, offset, model=model)
+    assets = [_video_asset_from_metadata(data) for data in rows]
 
     return VideoAssetListResponse(assets=assets, total=total)
 
@@ -349,6 +323,7 @@ async def delete_video_asset(asset_id: str):
         video_path.unlink()
     if metadata_path.exists():
         metadata_path.unlink()
+    get_asset_index().remove(asset_id)
 
     return {"status": "deleted", "id": asset_id}
 
@@ -379,8 +354,7 @@ def load_bulk_sessions() -> BulkSessionsData:
 def save_bulk_sessions(data: BulkSessionsData) -> None:
     """Save bulk sessions to file."""
     sessions_file = get_bulk_sessions_file()
-    with open(sessions_file, "w") as f:
-        json.dump(data.model_dump(), f, indent=2)
+    write_json(sessions_file, data.model_dump())
 
 
 # Bulk session endpoints
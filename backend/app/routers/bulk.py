@@ -14,6 +14,7 @@ from ..models.schemas import (
 )
 from ..services.llm_client import generate_prompt_variations
 from ..services.bulk_jobs import get_bulk_job_manager
+from ..dependencies import JobListQuery
 
 router = APIRouter(prefix="/api/bulk", tags=["bulk"])
 logger = logging.getLogger(__name__)
@@ -80,13 +81,11 @@ async def get_bulk_job(job_id: str):
 
 
 @router.get("/jobs", response_model=BulkJobListResponse)
-async def list_bulk_jobs():
+async def list_bulk_jobs(query: JobListQuery):
     """List all bulk jobs."""
     manager = get_bulk_job_manager()
-    with manager.lock:
-        jobs = list(manager.jobs.values())
-    # Sort by created_at descending
-    jobs.sort(key=lambda j: j.created_at, reverse=True)
+    # Newest first, read from the manager's creation-order index
+    jobs = manager.list_jobs(**query)
     return BulkJobListResponse(jobs=jobs)
 
 
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
 from typing import Optional
 
 from ..models.civitai_schemas import (
@@ -15,7 +16,10 @@ router = APIRouter(prefix="/api/civitai", tags=["civitai"])
 
 # ============== Browse Endpoints ==============
 
-@router.get("/models")
+# These proxy CivitAI's JSON as plain dicts (no response_model), so orjson
+# renders them directly; typed endpoints keep FastAPI's pydantic fast path
+
+@router.get("/models", response_class=ORJSONResponse)
 async def search_models(
     response: Response,
     query: Optional[str] = None,
@@ -45,7 +49,7 @@ async def search_models(
         raise HTTPException(status_code=502, detail=f"Civitai API error: {str(e)}")
 
 
-@router.get("/models/{model_id}")
+@router.get("/models/{model_id}", response_class=ORJSONResponse)
 async def get_model(model_id: int, response: Response):
     client = get_civitai_client()
     try:
@@ -15,9 +15,9 @@ import json
 import uuid
 import asyncio
 from datetime import datetime
-from typing import Optional
+from operator import attrgetter
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 
 from ..models.schemas import (
     ComfyUIStatusResponse,
@@ -40,6 +40,8 @@ from ..services.comfyui_jobs import (
     save_workflows,
     get_workflow_by_id,
 )
+from ..dependencies import JobListQuery
+from ..utils.http_cache import cached_json_response
 
 
 router = APIRouter(prefix="/api/comfyui", tags=["comfyui"])
@@ -48,7 +50,7 @@ router = APIRouter(prefix="/api/comfyui", tags=["comfyui"])
 # ============== Status Endpoints ==============
 
 @router.get("/status", response_model=ComfyUIStatusResponse)
-async def get_comfyui_status():
+async def get_comfyui_status(request: Request):
     """Check if ComfyUI server is running and get queue status."""
     client = get_comfyui_client()
 
@@ -66,13 +68,13 @@ async def get_comfyui_status():
     else:
         error = "ComfyUI server is not responding"
 
-    return ComfyUIStatusResponse(
+    return cached_json_response(request, ComfyUIStatusResponse(
         available=available,
         server_url=client.base_url,
         queue_running=queue_running,
         queue_pending=queue_pending,
         error=error,
-    )
+    ), max_age=5)
 
 
 # ============== Workflow Endpoints ==============
@@ -113,12 +115,13 @@ async def import_workflow(request: WorkflowImportRequest):
 
     # Create workflow entry
     workflow_id = str(uuid.uuid4())
+    now = datetime.utcnow()
     workflow = {
         "id": workflow_id,
         "name": request.name,
         "workflow_json": request.workflow_json,
         "parameters": [p.model_dump() for p in param_models],
-        "created_at": datetime.utcnow().isoformat(),
+        "created_at": now.isoformat(),
     }
 
     # Save to file
@@ -149,7 +152,7 @@ async def list_workflows():
         ))
 
     # Sort by created_at descending
-    summaries.sort(key=lambda w: w.created_at, reverse=True)
+    summaries.sort(key=attrgetter("created_at"), reverse=True)
     return summaries
 
 
@@ -218,22 +221,23 @@ async def update_workflow(workflow_id: str, request: WorkflowImportRequest):
         for p in params
     ]
 
-    # Update workflow
-    data["workflows"][workflow_idx]["name"] = request.name
-    data["workflows"][workflow_idx]["workflow_json"] = request.workflow_json
-    data["workflows"][workflow_idx]["parameters"] = param_dicts
-    data["workflows"][workflow_idx]["updated_at"] = datetime.utcnow().isoformat()
+    # Update workflow (reuse one timestamp for storage and response)
+    now = datetime.utcnow()
+    workflow = data["workflows"][workflow_idx]
+    workflow["name"] = request.name
+    workflow["workflow_json"] = request.workflow_json
+    workflow["parameters"] = param_dicts
+    workflow["updated_at"] = now.isoformat()
 
     save_workflows(data)
 
-    workflow = data["workflows"][workflow_idx]
     return SavedWorkflow(
         id=workflow["id"],
         name=workflow["name"],
         workflow_json=workflow["workflow_json"],
         parameters=[ComfyUIEditableParameter(**p) for p in param_dicts],
         created_at=datetime.fromisoformat(workflow["created_at"]),
-        updated_at=datetime.fromisoformat(workflow["updated_at"]),
+        updated_at=now,
     )
 
 
@@ -299,21 +303,10 @@ async def get_comfyui_job(job_id: str):
 
 
 @router.get("/jobs", response_model=ComfyUIJobListResponse)
-async def list_comfyui_jobs(session_id: Optional[str] = None, active_only: bool = False):
+async def list_comfyui_jobs(query: JobListQuery):
     """List ComfyUI jobs, optionally filtered."""
-    job_manager = get_comfyui_job_manager()
-
-    if session_id:
-        jobs = job_manager.get_jobs_by_session(session_id)
-    elif active_only:
-        jobs = job_manager.get_active_jobs()
-    else:
-        jobs = list(job_manager.jobs.values())
-
-    # Sort by created_at descending
-    jobs = sorted(jobs, key=lambda j: j.created_at, reverse=True)
-
-    return ComfyUIJobListResponse(jobs=jobs)
+    # Newest first, read from the manager's creation-order index
+    return ComfyUIJobListResponse(jobs=get_comfyui_job_manager().list_jobs(**query))
 
 
 # ============== Utility Endpoints ==============
@@ -341,7 +334,7 @@ async def clear_comfyui_queue():
 
 
 @router.get("/object-info")
-async def get_object_info():
+async def get_object_info(request: Request):
     """Get ComfyUI node information (useful for debugging)."""
     client = get_comfyui_client()
 
@@ -350,4 +343,4 @@ async def get_object_info():
         raise HTTPException(status_code=503, detail="ComfyUI not available")
 
     # Return just node names for brevity
-    return {"nodes": list(info.keys()), "total": len(info)}
+    return cached_json_response(request, {"nodes": list(info.keys()), "total": len(info)}, max_age=60)
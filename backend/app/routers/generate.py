@@ -1,12 +1,15 @@
+import asyncio
 import uuid
-import json
-import random
+import secrets
 import re
 import threading
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+import orjson
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from ..models.schemas import (
@@ -37,21 +40,113 @@ STYLE_PREFIXES = [
     r"^a picture of\s+",
 ]
 
+# Compiled once at import: style phrases are stripped anywhere in a single pass,
+# then leading "a photo of"-style phrases are stripped from what remains,
+# including stacked ones ("a photo of an image of ...")
+_STYLE_PREFIX_RE = re.compile(
+    "|".join(p for p in STYLE_PREFIXES if not p.startswith("^")), re.IGNORECASE
+)
+_LEADING_PHRASE_RE = re.compile(
+    "^(?:" + "|".join(p[1:] for p in STYLE_PREFIXES if p.startswith("^")) + ")+", re.IGNORECASE
+)
+
+# Sentence/clause separators; the title is cut at the first one found
+_CLAUSE_SEP_RE = re.compile(r"\. |, | - | \| ")
+
+# Optional Hyperscan DFA for the style-phrase scan (falls back to _STYLE_PREFIX_RE)
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+
+def _compile_style_db():
+    """Compile the unanchored style phrases into one Hyperscan block-mode database."""
+    patterns = [p.encode() for p in STYLE_PREFIXES if not p.startswith("^")]
+    flags = (
+        hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST
+        | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+    )
+    db = hyperscan.Database()
+    db.compile(
+        expressions=patterns,
+        ids=list(range(len(patterns))),
+        elements=len(patterns),
+        flags=[flags] * len(patterns),
+    )
+    return db
+
+
+_STYLE_DB = None
+if HYPERSCAN_AVAILABLE:
+    try:
+        _STYLE_DB = _compile_style_db()
+    except Exception as e:
+        print(f"Hyperscan style database unavailable, using re: {e}")
+# A database's scratch space isn't safe for concurrent scans
+_STYLE_DB_LOCK = threading.Lock()
+
 
+def _strip_style_phrases(prompt: str) -> str:
+    """Remove style phrases anywhere in the prompt, with the same result as _STYLE_PREFIX_RE.sub."""
+    if _STYLE_DB is None:
+        return _STYLE_PREFIX_RE.sub("", prompt)
+    try:
+        data = prompt.encode("utf-8")
+    except UnicodeEncodeError:
+        return _STYLE_PREFIX_RE.sub("", prompt)
+
+    # Hyperscan reports every (start, end) match; keep the longest end per start
+    longest: dict[int, int] = {}
+
+    def on_match(_id, start, end, _flags, _context):
+        if end > longest.get(start, -1):
+            longest[start] = end
+
+    with _STYLE_DB_LOCK:
+        _STYLE_DB.scan(data, match_event_handler=on_match)
+    if not longest:
+        return prompt
+
+    # Leftmost non-overlapping spans, as re.sub would pick them
+    parts = []
+    pos = 0
+    for start in sorted(longest):
+        if start < pos:
+            continue
+        parts.append(data[pos:start])
+        pos = longest[start]
+    parts.append(data[pos:])
+    return b"".join(parts).decode("utf-8")
+
+
+@lru_cache(maxsize=512)
 def generate_title_from_prompt(prompt: str) -> str:
-    """Generate a short title from a prompt by extracting key concepts."""
+    """Generate a short title from a prompt by extracting key concepts.
+
+    Pure function of the prompt, so repeated session-naming calls are memoized.
+    """
+    # Fast path: short single-clause prompts (<= 6 words, no style phrases)
+    # come out of the full pipeline unchanged apart from capitalization
+    stripped = prompt.strip()
+    if (
+        len(stripped) <= 50
+        and len(stripped.split()) <= 6
+        and not any(c in stripped for c in ".,|-")
+        and not _STYLE_PREFIX_RE.search(stripped)
+        and not _LEADING_PHRASE_RE.match(prompt)
+    ):
+        return stripped[:1].upper() + stripped[1:] if stripped else "New Session"
+
     # Remove style prefixes
-    cleaned = prompt
-    for prefix in STYLE_PREFIXES:
-        cleaned = re.sub(prefix, "", cleaned, flags=re.IGNORECASE)
+    cleaned = _strip_style_phrases(prompt)
+    cleaned = _LEADING_PHRASE_RE.sub("", cleaned, count=1)
 
     cleaned = cleaned.strip()
 
     # Take first sentence or clause
-    for sep in [". ", ", ", " - ", " | "]:
-        if sep in cleaned:
-            cleaned = cleaned.split(sep)[0]
-            break
+    cleaned = _CLAUSE_SEP_RE.split(cleaned, maxsplit=1)[0]
 
     # Limit to ~5-6 words
     words = cleaned.split()
@@ -73,70 +168,90 @@ def generate_title_from_prompt(prompt: str) -> str:
     return title or "New Session"
 
 
-from ..services.inference import get_inference_service
-from ..services.jobs import get_job_manager
-from ..services.lora_manager import get_lora_manager
-from ..services.hf_downloads import get_hf_download_tracker, HFDownloadJob
+from ..services.hf_downloads import HFDownloadJob
+from ..dependencies import InferenceServiceDep, JobManagerDep, LoRAManagerDep, HFDownloadTrackerDep, JobListQuery
 from ..utils.paths import get_output_dir
-from .settings import add_log, RequestLog
+from ..utils.images import encode_png, save_image_asset, image_io_executor
+from ..utils.json_io import json_bytes
+from ..utils.files import write_files
+from ..utils.cpu_affinity import inference_cores, pinned_to
+from ..utils.http_cache import ttl_cached_json_response, invalidate_cached_responses
+from ..utils.clock import now_iso
+from .settings import queue_log, RequestLog
 
 router = APIRouter(prefix="/api", tags=["generate"])
 
+# Direct (non-job) generation shares one pipeline; now that it runs off the
+# event loop, serialize it explicitly as the blocking loop used to
+_pipeline_lock = threading.Lock()
+
+
+def _run_on_pipeline(fn, /, **kwargs):
+    """Call a blocking inference method while holding the pipeline lock.
+
+    Runs on a shared executor thread, so it is pinned to the inference cores
+    only for the duration of the call.
+    """
+    with _pipeline_lock, pinned_to(inference_cores()):
+        return fn(**kwargs)
+
 
 def _detect_hostname() -> str | None:
     """Detect preferred hostname. Returns 'spark.local' on DGX Spark devices."""
     try:
-        with open("/etc/dgx-release") as f:
-            for line in f:
-                if "DGX Spark" in line:
-                    return "spark.local"
+        if "DGX Spark" in Path("/etc/dgx-release").read_text(errors="ignore"):
+            return "spark.local"
     except FileNotFoundError:
         pass
     return None
 
 
+# /etc/dgx-release doesn't change at runtime, so detect once at import
+_CACHED_HOSTNAME = _detect_hostname()
+
+
 @router.get("/health", response_model=HealthResponse)
-async def health_check():
-    service = get_inference_service()
+async def health_check(service: InferenceServiceDep):
     return HealthResponse(
         status="ok",
         gpu_available=service.is_gpu_available(),
         current_model=service.current_model_id,
-        hostname=_detect_hostname(),
+        hostname=_CACHED_HOSTNAME,
     )
 
 
+# TTL-cached model endpoints; is_cached/size data changes on download or delete
+_MODEL_CACHE_KEYS = ("models", "models_detailed", "cache_status")
+
+
 @router.get("/models", response_model=ModelsResponse)
-async def list_models():
-    service = get_inference_service()
-    models = service.get_available_models()
-    return ModelsResponse(
-        models=models,
+async def list_models(request: Request, service: InferenceServiceDep):
+    # Keyed on the loaded model so switching models never serves a stale current_model
+    return await ttl_cached_json_response(request, f"models:{service.current_model_id}", lambda: ModelsResponse(
+        models=service.get_available_models(),
         current_model=service.current_model_id,
-    )
+    ))
 
 
 @router.get("/models/detailed", response_model=ModelsDetailedResponse)
-async def list_models_detailed():
+async def list_models_detailed(request: Request, service: InferenceServiceDep):
     """Get detailed model info including actual cache sizes and statistics."""
-    service = get_inference_service()
-    result = service.get_models_detailed()
-    return ModelsDetailedResponse(**result)
+    return await ttl_cached_json_response(
+        request, "models_detailed", lambda: ModelsDetailedResponse(**service.get_models_detailed()),
+    )
 
 
 @router.get("/models/cache-status", response_model=CacheStatusResponse)
-async def get_cache_status():
+async def get_cache_status(request: Request, service: InferenceServiceDep):
     """Get overall cache usage statistics."""
-    service = get_inference_service()
-    result = service.get_cache_status()
-    return CacheStatusResponse(**result)
+    return await ttl_cached_json_response(
+        request, "cache_status", lambda: CacheStatusResponse(**service.get_cache_status()),
+    )
 
 
 @router.delete("/models/{model_id}/cache", response_model=CacheDeleteResponse)
-async def delete_model_cache(model_id: str):
+async def delete_model_cache(model_id: str, service: InferenceServiceDep):
     """Delete cached files for a specific model to free up space."""
-    service = get_inference_service()
-
     # Don't allow deleting currently loaded model
     if service.current_model_id == model_id:
         raise HTTPException(
@@ -145,6 +260,7 @@ async def delete_model_cache(model_id: str):
         )
 
     result = service.delete_model_cache(model_id)
+    invalidate_cached_responses(*_MODEL_CACHE_KEYS)
 
     if not result["success"] and result.get("error") == "Model not found":
         raise HTTPException(status_code=404, detail="Model not found")
@@ -153,10 +269,8 @@ async def delete_model_cache(model_id: str):
 
 
 @router.post("/models/{model_id}/download")
-async def download_model(model_id: str):
+async def download_model(model_id: str, service: InferenceServiceDep, tracker: HFDownloadTrackerDep):
     """Pre-download a model to cache without loading it into memory."""
-    service = get_inference_service()
-
     # Check if model exists in config
     model_config = service.get_model_config(model_id)
     if not model_config:
@@ -167,7 +281,6 @@ async def download_model(model_id: str):
         return {"status": "already_cached", "model_id": model_id}
 
     # Create tracked download job
-    tracker = get_hf_download_tracker()
     model_name = model_config.get("name", model_id)
     model_path = model_config.get("path", model_id)
     job = tracker.create_job(model_id, model_name, model_path)
@@ -180,6 +293,7 @@ async def download_model(model_id: str):
         try:
             service.download_model(model_id, progress_callback=progress_cb)
             tracker.complete_job(job.id)
+            invalidate_cached_responses(*_MODEL_CACHE_KEYS)
         except Exception as e:
             print(f"Error downloading model {model_id}: {e}")
             tracker.fail_job(job.id, str(e))
@@ -191,9 +305,8 @@ async def download_model(model_id: str):
 
 
 @router.get("/models/downloads", response_model=list[HFDownloadJob])
-async def list_hf_downloads():
+async def list_hf_downloads(tracker: HFDownloadTrackerDep):
     """List active and recent HuggingFace model downloads."""
-    tracker = get_hf_download_tracker()
     tracker.cleanup_old_jobs()
     return tracker.get_all_jobs()
 
@@ -205,73 +318,88 @@ async def generate_title(request: TitleRequest):
     return TitleResponse(title=title)
 
 
-@router.post("/generate", response_model=GenerateResponse)
-async def generate_images(request: GenerateRequest):
-    service = get_inference_service()
+def _metadata_template(
+    request: GenerateRequest, batch_id: str, steps: int, guidance_scale: float, created_at_iso: str,
+) -> dict:
+    """Build the metadata fields shared by every image in a batch.
+
+    id, filename and seed are placeholders so per-image copies keep the
+    sidecar key order.
+    """
+    return {
+        "id": None,
+        "filename": None,
+        "prompt": request.prompt,
+        "negative_prompt": request.negative_prompt,
+        "model": request.model,
+        "width": request.width,
+        "height": request.height,
+        "steps": steps,
+        "guidance_scale": guidance_scale,
+        "seed": None,
+        "batch_id": batch_id,
+        "created_at": created_at_iso,
+        "loras": [{"lora_id": l.lora_id, "weight": l.weight} for l in request.loras] if request.loras else None,
+    }
+
 
+@router.post("/generate", response_model=GenerateResponse)
+async def generate_images(request: GenerateRequest, service: InferenceServiceDep):
     # Validate model exists
     model_config = service.get_model_config(request.model)
     if not model_config:
         raise HTTPException(status_code=400, detail=f"Unknown model: {request.model}")
 
     try:
-        batch_id = request.batch_id or str(uuid.uuid4())
+        batch_id = request.batch_id or uuid.uuid4().hex
         output_dir = get_output_dir()
-        created_at = datetime.utcnow()
+        created_at = datetime.now(timezone.utc)
+        created_at_iso = created_at.isoformat()
 
         # Determine actual values used
         steps_used = request.steps if request.steps else model_config["default_steps"]
         guidance_used = request.guidance_scale if request.guidance_scale is not None else model_config["default_guidance"]
 
         # Generate base seed if not provided
-        base_seed = request.seed if request.seed is not None else random.randint(0, 2**32 - 1)
+        base_seed = request.seed if request.seed is not None else secrets.randbits(32)
 
         images_results = []
 
-        # Generate multiple images with different seeds
-        for i in range(request.num_images):
-            # Use different seed for each image (base_seed + offset)
-            image_seed = base_seed + i
+        # Generate all images in one batched call, one seed per image (base_seed + offset).
+        # Diffusion blocks for seconds, so it runs in a worker thread to keep the loop responsive.
+        generated = await asyncio.to_thread(
+            _run_on_pipeline,
+            service.generate_batch,
+            prompt=request.prompt,
+            model_id=request.model,
+            seeds=[(base_seed + i) % 2**32 for i in range(request.num_images)],
+            negative_prompt=request.negative_prompt,
+            width=request.width,
+            height=request.height,
+            steps=request.steps,
+            guidance_scale=request.guidance_scale,
+            loras=request.loras,
+        )
 
-            image, actual_seed = service.generate(
-                prompt=request.prompt,
-                model_id=request.model,
-                negative_prompt=request.negative_prompt,
-                width=request.width,
-                height=request.height,
-                steps=request.steps,
-                guidance_scale=request.guidance_scale,
-                seed=image_seed,
-                loras=request.loras,
-            )
+        # Encode PNGs in parallel on the shared image pool (PIL releases the GIL in zlib)
+        loop = asyncio.get_running_loop()
+        encoded = await asyncio.gather(*(
+            loop.run_in_executor(image_io_executor, encode_png, image) for image, _ in generated
+        ))
+
+        # Fields shared by every image in the batch are built once
+        template = _metadata_template(request, batch_id, steps_used, guidance_used, created_at_iso)
 
-            # Save image and metadata
-            asset_id = str(uuid.uuid4())
+        pending_files = []
+        for (image, actual_seed), png_bytes in zip(generated, encoded):
+            asset_id = uuid.uuid4().hex
             image_path = output_dir / f"{asset_id}.png"
             metadata_path = output_dir / f"{asset_id}.json"
 
-            # Save image
-            image.save(image_path, "PNG")
-
-            # Save metadata
-            metadata = {
-                "id": asset_id,
-                "filename": f"{asset_id}.png",
-                "prompt": request.prompt,
-                "negative_prompt": request.negative_prompt,
-                "model": request.model,
-                "width": request.width,
-                "height": request.height,
-                "steps": steps_used,
-                "guidance_scale": guidance_used,
-                "seed": actual_seed,
-                "batch_id": batch_id,
-                "created_at": created_at.isoformat(),
-                "loras": [{"lora_id": l.lora_id, "weight": l.weight} for l in request.loras] if request.loras else None,
-            }
-
-            with open(metadata_path, "w") as f:
-                json.dump(metadata, f, indent=2)
+            metadata = dict(template, id=asset_id, filename=f"{asset_id}.png", seed=actual_seed)
+
+            pending_files.append((image_path, png_bytes))
+            pending_files.append((metadata_path, json_bytes(metadata)))
 
             images_results.append(ImageResult(
                 id=asset_id,
@@ -280,6 +408,9 @@ async def generate_images(request: GenerateRequest):
                 seed=actual_seed,
             ))
 
+        # Flush the whole batch (PNG + JSON per image) in one worker-thread hop
+        await loop.run_in_executor(image_io_executor, write_files, pending_files)
+
         return GenerateResponse(
             batch_id=batch_id,
             prompt=request.prompt,
@@ -296,25 +427,98 @@ async def generate_images(request: GenerateRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _stream_images(request: GenerateRequest, service, model_config: dict):
+    """Generate images one at a time, yielding an NDJSON line as each is saved."""
+    batch_id = request.batch_id or uuid.uuid4().hex
+    output_dir = get_output_dir()
+    created_at = datetime.now(timezone.utc)
+    created_at_iso = created_at.isoformat()
+
+    steps_used = request.steps if request.steps else model_config["default_steps"]
+    guidance_used = request.guidance_scale if request.guidance_scale is not None else model_config["default_guidance"]
+    base_seed = request.seed if request.seed is not None else secrets.randbits(32)
+    template = _metadata_template(request, batch_id, steps_used, guidance_used, created_at_iso)
+
+    yield orjson.dumps({
+        "type": "batch",
+        "batch_id": batch_id,
+        "prompt": request.prompt,
+        "model": request.model,
+        "width": request.width,
+        "height": request.height,
+        "steps": steps_used,
+        "guidance_scale": guidance_used,
+        "created_at": created_at_iso,
+    }) + b"\n"
+
+    try:
+        for i in range(request.num_images):
+            # Diffusion blocks for seconds; keep the event loop free to flush earlier lines
+            image, actual_seed = await asyncio.to_thread(
+                _run_on_pipeline,
+                service.generate,
+                prompt=request.prompt,
+                model_id=request.model,
+                negative_prompt=request.negative_prompt,
+                width=request.width,
+                height=request.height,
+                steps=request.steps,
+                guidance_scale=request.guidance_scale,
+                seed=(base_seed + i) % 2**32,
+                loras=request.loras,
+            )
+
+            asset_id = uuid.uuid4().hex
+            metadata = dict(template, id=asset_id, filename=f"{asset_id}.png", seed=actual_seed)
+            await asyncio.get_running_loop().run_in_executor(
+                image_io_executor, save_image_asset,
+                image, output_dir / f"{asset_id}.png", metadata, output_dir / f"{asset_id}.json",
+            )
+
+            result = ImageResult(
+                id=asset_id,
+                filename=f"{asset_id}.png",
+                url=f"/outputs/{asset_id}.png",
+                seed=actual_seed,
+            )
+            yield orjson.dumps({"type": "image", **result.model_dump()}) + b"\n"
+
+        yield orjson.dumps({"type": "done", "batch_id": batch_id, "count": request.num_images}) + b"\n"
+
+    except Exception as e:
+        # Headers are already sent, so report failures in-band
+        yield orjson.dumps({"type": "error", "detail": str(e)}) + b"\n"
+
+
+@router.post("/generate/stream")
+async def generate_images_stream(request: GenerateRequest, service: InferenceServiceDep):
+    """Generate images and stream each result as NDJSON as soon as it is saved."""
+    model_config = service.get_model_config(request.model)
+    if not model_config:
+        raise HTTPException(status_code=400, detail=f"Unknown model: {request.model}")
+
+    return StreamingResponse(
+        _stream_images(request, service, model_config),
+        media_type="application/x-ndjson",
+    )
+
+
 # ============== Job-based Generation Endpoints ==============
 
 @router.post("/jobs", response_model=JobResponse)
-async def create_job(request: GenerateRequest):
+async def create_job(request: GenerateRequest, service: InferenceServiceDep, job_manager: JobManagerDep):
     """Create a new generation job. Returns immediately with job_id."""
-    service = get_inference_service()
-
     # Validate model exists
     model_config = service.get_model_config(request.model)
     if not model_config:
         raise HTTPException(status_code=400, detail=f"Unknown model: {request.model}")
 
-    job_manager = get_job_manager()
     job = job_manager.create_job(request)
 
-    # Log the request
+    # Log the request (persisted in batches by the log writer)
     log_entry = RequestLog(
         id=job.id,
-        timestamp=datetime.now().isoformat(),
+        timestamp=now_iso(),
         type="image",
         prompt=request.prompt,
         negative_prompt=request.negative_prompt,
@@ -331,7 +535,7 @@ async def create_job(request: GenerateRequest):
         status="pending",
         source_image_urls=job.source_image_urls if job.source_image_urls else None,
     )
-    add_log(log_entry)
+    queue_log(log_entry)
 
     return JobResponse(
         job_id=job.id,
@@ -341,9 +545,8 @@ async def create_job(request: GenerateRequest):
 
 
 @router.get("/jobs/{job_id}", response_model=Job)
-async def get_job(job_id: str):
+async def get_job(job_id: str, job_manager: JobManagerDep):
     """Get the status of a specific job."""
-    job_manager = get_job_manager()
     job = job_manager.get_job(job_id)
 
     if not job:
@@ -353,29 +556,17 @@ async def get_job(job_id: str):
 
 
 @router.get("/jobs", response_model=JobListResponse)
-async def list_jobs(session_id: str = None, active_only: bool = False):
+async def list_jobs(job_manager: JobManagerDep, query: JobListQuery):
     """List jobs, optionally filtered by session or active status."""
-    job_manager = get_job_manager()
-
-    if session_id:
-        jobs = job_manager.get_jobs_by_session(session_id)
-    elif active_only:
-        jobs = job_manager.get_active_jobs()
-    else:
-        jobs = list(job_manager.jobs.values())
-
-    # Sort by created_at descending
-    jobs = sorted(jobs, key=lambda j: j.created_at, reverse=True)
-
-    return JobListResponse(jobs=jobs)
+    # Newest first, read from the manager's creation-order index
+    return JobListResponse(jobs=job_manager.list_jobs(**query))
 
 
 # ============== LoRA Endpoints ==============
 
 @router.get("/loras", response_model=LoRAListResponse)
-async def list_loras(model_type: str = None):
+async def list_loras(lora_manager: LoRAManagerDep, model_type: str = None):
     """List available LoRAs, optionally filtered by compatible model type."""
-    lora_manager = get_lora_manager()
     loras = lora_manager.get_available_loras(model_type)
     return LoRAListResponse(
         loras=loras,
@@ -384,9 +575,8 @@ async def list_loras(model_type: str = None):
 
 
 @router.post("/loras/scan", response_model=LoRAScanResponse)
-async def scan_local_loras():
+async def scan_local_loras(lora_manager: LoRAManagerDep):
     """Rescan local LoRA directory for new files."""
-    lora_manager = get_lora_manager()
     local_loras = lora_manager.scan_local_loras()
     return LoRAScanResponse(
         count=len(local_loras),
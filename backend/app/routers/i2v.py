@@ -1,31 +1,39 @@
 """Image-to-Video (I2V) job endpoints."""
 
-from datetime import datetime
+import asyncio
 
 from fastapi import APIRouter, HTTPException
 
 from ..models.schemas import (
     I2VGenerateRequest, I2VJob, I2VJobResponse, I2VJobListResponse,
 )
-from ..services.inference import get_inference_service
-from ..services.i2v_jobs import get_i2v_job_manager
+from ..services.i2v_jobs import I2V_MODEL_TYPES
 from ..services.resources import check_resources_for_video
-from .settings import add_log, RequestLog
+from ..dependencies import InferenceServiceDep, I2VJobManagerDep, JobListQuery
+from ..utils.clock import now_iso
+from .settings import queue_log, RequestLog
 
 router = APIRouter(prefix="/api", tags=["i2v"])
 
+# Request fields copied verbatim into the request log's parameters
+_LOG_PARAMETER_FIELDS = frozenset({
+    "width", "height", "motion_bucket_id", "noise_aug_strength", "seed", "image_asset_id",
+})
+
 
 @router.post("/i2v/jobs", response_model=I2VJobResponse)
-async def create_i2v_job(request: I2VGenerateRequest):
+async def create_i2v_job(
+    request: I2VGenerateRequest,
+    service: InferenceServiceDep,
+    i2v_job_manager: I2VJobManagerDep,
+):
     """Create a new image-to-video generation job. Returns immediately with job_id."""
-    service = get_inference_service()
-
     # Validate model exists and is an I2V model
-    model_config = service.get_model_config(request.model)
-    if not model_config:
+    model_spec = service.get_model_spec(request.model)
+    if model_spec is None:
         raise HTTPException(status_code=400, detail=f"Unknown model: {request.model}")
 
-    if model_config.get("type") not in ["video-i2v", "svd", "wan-i2v"]:
+    if model_spec.type not in I2V_MODEL_TYPES:
         raise HTTPException(status_code=400, detail=f"Model {request.model} does not support I2V")
 
     # Validate image source is provided
@@ -33,10 +41,7 @@ async def create_i2v_job(request: I2VGenerateRequest):
         raise HTTPException(status_code=400, detail="Must provide reference_images, image_base64, or image_asset_id")
 
     # Check system resources before accepting job
-    # Use memory_gb (actual RAM) if available, otherwise fall back to size_gb (disk size)
-    model_memory_gb = model_config.get("memory_gb") or model_config.get("size_gb", 12)
-    model_name = model_config.get("name", request.model)
-    resource_status = check_resources_for_video(model_memory_gb, model_name)
+    resource_status = await asyncio.to_thread(check_resources_for_video, model_spec.memory_gb, model_spec.name)
 
     if not resource_status.is_available:
         raise HTTPException(
@@ -54,31 +59,25 @@ async def create_i2v_job(request: I2VGenerateRequest):
         )
 
     try:
-        i2v_job_manager = get_i2v_job_manager()
         job = i2v_job_manager.create_job(request)
 
-        # Log the request
+        # Log the request (persisted in batches by the log writer)
         log_entry = RequestLog(
             id=job.id,
-            timestamp=datetime.now().isoformat(),
+            timestamp=now_iso(),
             type="i2v",
             prompt=request.prompt or "Image-to-Video",
             negative_prompt=request.negative_prompt,
             model=request.model,
             parameters={
-                "width": request.width,
-                "height": request.height,
+                **request.model_dump(include=_LOG_PARAMETER_FIELDS),
                 "num_frames": request.num_frames or 24,
                 "fps": request.fps or 6,
-                "motion_bucket_id": request.motion_bucket_id,
-                "noise_aug_strength": request.noise_aug_strength,
-                "seed": request.seed,
-                "image_asset_id": request.image_asset_id,
             },
             status="pending",
             source_image_urls=job.source_image_urls if job.source_image_urls else None,
         )
-        add_log(log_entry)
+        queue_log(log_entry)
 
         return I2VJobResponse(
             job_id=job.id,
@@ -90,9 +89,8 @@ async def create_i2v_job(request: I2VGenerateRequest):
 
 
 @router.get("/i2v/jobs/{job_id}", response_model=I2VJob)
-async def get_i2v_job(job_id: str):
+async def get_i2v_job(job_id: str, i2v_job_manager: I2VJobManagerDep):
     """Get the status of a specific I2V job."""
-    i2v_job_manager = get_i2v_job_manager()
     job = i2v_job_manager.get_job(job_id)
 
     if not job:
@@ -102,18 +100,7 @@ async def get_i2v_job(job_id: str):
 
 
 @router.get("/i2v/jobs", response_model=I2VJobListResponse)
-async def list_i2v_jobs(session_id: str = None, active_only: bool = False):
+async def list_i2v_jobs(i2v_job_manager: I2VJobManagerDep, query: JobListQuery):
     """List I2V jobs, optionally filtered by session or active status."""
-    i2v_job_manager = get_i2v_job_manager()
-
-    if session_id:
-        jobs = i2v_job_manager.get_jobs_by_session(session_id)
-    elif active_only:
-        jobs = i2v_job_manager.get_active_jobs()
-    else:
-        jobs = list(i2v_job_manager.jobs.values())
-
-    # Sort by created_at descending
-    jobs = sorted(jobs, key=lambda j: j.created_at, reverse=True)
-
-    return I2VJobListResponse(jobs=jobs)
+    # Newest first, read from the manager's creation-order index
+    return I2VJobListResponse(jobs=i2v_job_manager.list_jobs(**query))
@@ -1,16 +1,22 @@
 """Remote provider configuration endpoints"""
 
-import json
+import asyncio
 import logging
+import os
 import re
-from pathlib import Path
+import threading
+import time
+from collections import defaultdict
+from functools import lru_cache
 from typing import Optional
 
 import httpx
+import orjson
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
 from ..utils.paths import get_data_dir
+from ..utils.json_io import json_bytes
 
 router = APIRouter(prefix="/api/providers", tags=["providers"])
 logger = logging.getLogger(__name__)
@@ -39,9 +45,21 @@ KNOWN_PROVIDERS = {
     },
 }
 
+# Immutable views of KNOWN_PROVIDERS for validation and listing order
+_KNOWN_IDS: frozenset[str] = frozenset(KNOWN_PROVIDERS)
+_KNOWN_IDS_SORTED: tuple[str, ...] = tuple(sorted(KNOWN_PROVIDERS))
+
 # Providers file path
 _PROVIDERS_PATH = get_data_dir() / "providers.json"
 
+# Shared client for provider calls so keep-alive connections (and their
+# TLS sessions) are reused across test/discover requests
+_http_client: Optional[httpx.AsyncClient] = None
+
+# Parsed providers.json keyed on its mtime_ns; reads only stat() the file
+_providers_cache: Optional[tuple[int, dict]] = None
+_providers_lock = threading.Lock()
+
 
 # ============================================================================
 # Models
@@ -96,7 +114,7 @@ class DiscoverResponse(BaseModel):
 
 
 # Providers that support auto-discovery
-DISCOVERY_PROVIDERS = {"krea", "fal"}
+DISCOVERY_PROVIDERS = frozenset({"krea", "fal"})
 
 
 # ============================================================================
@@ -104,38 +122,80 @@ DISCOVERY_PROVIDERS = {"krea", "fal"}
 # ============================================================================
 
 def _load_providers() -> dict:
-    """Load providers from JSON file"""
-    if _PROVIDERS_PATH.exists():
+    """Load providers from JSON file, re-parsing only when it changed on disk.
+
+    The returned dict is shared; copy before mutating.
+    """
+    global _providers_cache
+    try:
+        mtime_ns = _PROVIDERS_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    with _providers_lock:
+        if _providers_cache is not None and _providers_cache[0] == mtime_ns:
+            return _providers_cache[1]
         try:
-            with open(_PROVIDERS_PATH) as f:
-                return json.load(f)
+            data = orjson.loads(_PROVIDERS_PATH.read_bytes())
         except Exception as e:
             logger.error(f"Failed to load providers: {e}")
-    return {}
+            return {}
+        _providers_cache = (mtime_ns, data)
+        return data
 
 
 def _save_providers(data: dict) -> None:
     """Save providers to JSON file"""
-    _DATA_DIR.mkdir(parents=True, exist_ok=True)
+    global _providers_cache
     try:
-        with open(_PROVIDERS_PATH, "w") as f:
-            json.dump(data, f, indent=2)
+        with _providers_lock:
+            _PROVIDERS_PATH.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so readers never see a half-written file; one
+            # fsync of the temp file makes the swapped-in contents durable
+            tmp_path = _PROVIDERS_PATH.with_suffix(".json.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(json_bytes(data))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, _PROVIDERS_PATH)
+            _providers_cache = (_PROVIDERS_PATH.stat().st_mtime_ns, data)
     except Exception as e:
         logger.error(f"Failed to save providers: {e}")
         raise HTTPException(status_code=500, detail="Failed to save provider configuration")
 
 
+async def _get_client() -> httpx.AsyncClient:
+    """Get or create the shared async HTTP client."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(timeout=15.0)
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (called on app shutdown)."""
+    global _http_client
+    if _http_client and not _http_client.is_closed:
+        await _http_client.aclose()
+        _http_client = None
+
+
+@lru_cache(maxsize=None)
+def _unconfigured_config(provider_id: str) -> ProviderConfig:
+    """Config for a provider with nothing stored (shared; never mutated)"""
+    return ProviderConfig(
+        provider=provider_id,
+        is_configured=False,
+        is_enabled=False,
+        api_url=KNOWN_PROVIDERS.get(provider_id, {}).get("default_api_url"),
+        has_api_key=False,
+    )
+
+
 def _make_config(provider_id: str, raw: dict | None) -> ProviderConfig:
     """Build a public ProviderConfig from stored data"""
-    default_url = KNOWN_PROVIDERS.get(provider_id, {}).get("default_api_url")
     if raw is None:
-        return ProviderConfig(
-            provider=provider_id,
-            is_configured=False,
-            is_enabled=False,
-            api_url=default_url,
-            has_api_key=False,
-        )
+        return _unconfigured_config(provider_id)
+    default_url = KNOWN_PROVIDERS.get(provider_id, {}).get("default_api_url")
     has_key = bool(raw.get("api_key"))
     is_enabled = raw.get("is_enabled", True)
     return ProviderConfig(
@@ -149,7 +209,7 @@ def _make_config(provider_id: str, raw: dict | None) -> ProviderConfig:
 
 def _validate_provider(provider_id: str) -> None:
     """Raise 404 if provider is unknown"""
-    if provider_id not in KNOWN_PROVIDERS:
+    if provider_id not in _KNOWN_IDS:
         raise HTTPException(status_code=404, detail=f"Unknown provider: {provider_id}")
 
 
@@ -160,8 +220,8 @@ def _validate_provider(provider_id: str) -> None:
 @router.get("", response_model=AllProvidersResponse)
 async def get_providers():
     """Get all provider configurations"""
-    data = _load_providers()
-    configs = [_make_config(pid, data.get(pid)) for pid in sorted(KNOWN_PROVIDERS)]
+    data = await asyncio.to_thread(_load_providers)
+    configs = [_make_config(pid, data.get(pid)) for pid in _KNOWN_IDS_SORTED]
     return AllProvidersResponse(providers=configs)
 
 
@@ -169,7 +229,7 @@ async def get_providers():
 async def get_provider(provider_id: str):
     """Get a single provider configuration"""
     _validate_provider(provider_id)
-    data = _load_providers()
+    data = await asyncio.to_thread(_load_providers)
     return _make_config(provider_id, data.get(provider_id))
 
 
@@ -178,8 +238,8 @@ async def update_provider(provider_id: str, request: ProviderUpdateRequest):
     """Update a provider's configuration"""
     _validate_provider(provider_id)
 
-    data = _load_providers()
-    existing = data.get(provider_id, {})
+    data = dict(await asyncio.to_thread(_load_providers))
+    existing = dict(data.get(provider_id, {}))
 
     if request.api_key is not None:
         existing["api_key"] = request.api_key
@@ -189,7 +249,7 @@ async def update_provider(provider_id: str, request: ProviderUpdateRequest):
         existing["is_enabled"] = request.is_enabled
 
     data[provider_id] = existing
-    _save_providers(data)
+    await asyncio.to_thread(_save_providers, data)
 
     logger.info(f"Updated provider: {provider_id}")
     return _make_config(provider_id, existing)
@@ -200,10 +260,10 @@ async def delete_provider(provider_id: str):
     """Remove a provider's configuration (clear key)"""
     _validate_provider(provider_id)
 
-    data = _load_providers()
+    data = await asyncio.to_thread(_load_providers)
     if provider_id in data:
-        del data[provider_id]
-        _save_providers(data)
+        remaining = {pid: raw for pid, raw in data.items() if pid != provider_id}
+        await asyncio.to_thread(_save_providers, remaining)
 
     logger.info(f"Deleted provider config: {provider_id}")
     return _make_config(provider_id, None)
@@ -214,7 +274,7 @@ async def test_provider_connection(provider_id: str):
     """Test connection to a provider using its configured API key and URL"""
     _validate_provider(provider_id)
 
-    data = _load_providers()
+    data = await asyncio.to_thread(_load_providers)
     raw = data.get(provider_id)
 
     if not raw or not raw.get("api_key"):
@@ -228,14 +288,15 @@ async def test_provider_connection(provider_id: str):
     api_url = raw.get("api_url") or KNOWN_PROVIDERS[provider_id]["default_api_url"]
 
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(
-                api_url,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Accept": "application/json",
-                },
-            )
+        client = await _get_client()
+        response = await client.get(
+            api_url,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Accept": "application/json",
+            },
+            timeout=5.0,
+        )
 
         if response.status_code < 500:
             return TestConnectionResponse(
@@ -321,55 +382,105 @@ def _format_model_name(slug: str, vendor: str) -> str:
     return f"{nice_name} ({nice_vendor})"
 
 
+_UNSAFE_ID_CHARS = re.compile(r"[^a-z0-9-]")
+
+
 def _sanitize_id(text: str) -> str:
     """Create a safe ID string."""
-    return re.sub(r"[^a-z0-9-]", "-", text.lower())
+    return _UNSAFE_ID_CHARS.sub("-", text.lower())
+
+
+def _keyword_matcher(rules: list[tuple[str, tuple[str, ...]]]):
+    """Compile ordered (label, keywords) rules into a single regex scan.
+
+    Each rule is a lookahead branch anchored at the start, tried in order, so
+    the first rule with any keyword anywhere in the text wins - the same
+    priority as a chain of ``in`` checks. Returns text -> label or None.
+    """
+    branches = "|".join(f"(?=.*?({'|'.join(map(re.escape, keywords))}))" for _, keywords in rules)
+    pattern = re.compile(f"^(?:{branches})", re.DOTALL)
+    labels = [label for label, _ in rules]
+
+    def match(text: str) -> Optional[str]:
+        m = pattern.match(text)
+        return labels[m.lastindex - 1] if m else None
+
+    return match
+
+
+_match_image_input_type = _keyword_matcher([
+    ("image-to-image", ("edit", "img2img", "image-to-image")),
+    ("image-editing", ("inpaint", "outpaint")),
+    ("face", ("face",)),  # also covers "faceswap"
+    ("upscaling", ("upscale",)),  # also covers "upscaler"
+])
+
+_match_video_input_type = _keyword_matcher([
+    ("image-to-video", ("img2vid", "image-to-video")),
+    ("video-to-video", ("vid2vid", "video-to-video")),
+    ("lipsync", ("lipsync",)),
+])
+
+
+# fal endpoint IDs; "edit" resolves by model type at the call site
+_match_fal_endpoint_type = _keyword_matcher([
+    ("edit", ("edit",)),
+    ("image-to-image", ("img2img", "image-to-image")),
+    ("image-to-video", ("img2vid", "image-to-video")),
+    ("image-editing", ("inpaint", "outpaint")),
+    ("upscaling", ("upscale",)),
+    ("face", ("face",)),
+    ("lipsync", ("lipsync",)),
+])
 
 
 def _detect_image_input_type(slug: str) -> str:
     """Detect image model input type from its slug."""
-    s = slug.lower()
-    if "edit" in s or "img2img" in s or "image-to-image" in s:
-        return "image-to-image"
-    if "inpaint" in s or "outpaint" in s:
-        return "image-editing"
-    if "face" in s or "faceswap" in s:
-        return "face"
-    if "upscale" in s or "upscaler" in s:
-        return "upscaling"
-    return "text-to-image"
+    return _match_image_input_type(slug.lower()) or "text-to-image"
 
 
 def _detect_video_input_type(slug: str) -> str:
     """Detect video model input type from its slug."""
-    s = slug.lower()
-    if "img2vid" in s or "image-to-video" in s:
-        return "image-to-video"
-    if "vid2vid" in s or "video-to-video" in s:
-        return "video-to-video"
-    if "lipsync" in s:
-        return "lipsync"
-    return "text-to-video"
+    return _match_video_input_type(slug.lower()) or "text-to-video"
+
+
+# Path kinds under /generate/ that describe a model
+_KREA_MODEL_KINDS = frozenset({"image", "video", "enhance"})
 
 
 async def _discover_krea_models() -> list[DiscoveredModel]:
     """Discover models from KREA's public OpenAPI spec."""
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        response = await client.get("https://api.krea.ai/openapi.json")
-        response.raise_for_status()
-        spec = response.json()
+    client = await _get_client()
+    response = await client.get("https://api.krea.ai/openapi.json")
+    response.raise_for_status()
+    paths = orjson.loads(response.content).get("paths") or {}
+    # Only paths is walked; let the raw body and the rest of the spec go now
+    del response
 
     models: list[DiscoveredModel] = []
-
-    for path_key, path_value in (spec.get("paths") or {}).items():
-        post_spec = (path_value or {}).get("post", {})
+    # Fields are strings built right here; skip per-item validation
+    new_model = DiscoveredModel.model_construct
+
+    for path_key, path_value in paths.items():
+        # Only /generate/{kind}/{vendor}/{model} paths describe models
+        if not path_key.startswith("/generate/"):
+            continue
+        parts = path_key.split("/")
+        if len(parts) != 5 or not parts[3] or not parts[4]:
+            continue
+        kind, vendor, model_slug = parts[2], parts[3], parts[4]
+        if kind not in _KREA_MODEL_KINDS:
+            continue
+
+        # Generation endpoints are POSTs; skip status/GET-only paths
+        post_spec = path_value.get("post") if path_value else None
+        if post_spec is None:
+            continue
         summary = post_spec.get("summary") or post_spec.get("description") or ""
 
         # /generate/image/{vendor}/{model}
-        image_match = re.match(r"^/generate/image/([^/]+)/([^/]+)$", path_key)
-        if image_match:
-            vendor, model_slug = image_match.group(1), image_match.group(2)
-            models.append(DiscoveredModel(
+        if kind == "image":
+            models.append(new_model(
                 id=_sanitize_id(f"krea-{vendor}-{model_slug}"),
                 name=_format_model_name(model_slug, vendor),
                 description=summary or f"{vendor} {model_slug} model",
@@ -381,10 +492,8 @@ async def _discover_krea_models() -> list[DiscoveredModel]:
             ))
 
         # /generate/video/{vendor}/{model}
-        video_match = re.match(r"^/generate/video/([^/]+)/([^/]+)$", path_key)
-        if video_match:
-            vendor, model_slug = video_match.group(1), video_match.group(2)
-            models.append(DiscoveredModel(
+        elif kind == "video":
+            models.append(new_model(
                 id=_sanitize_id(f"krea-{vendor}-{model_slug}"),
                 name=_format_model_name(model_slug, vendor),
                 description=summary or f"{vendor} {model_slug} video model",
@@ -396,10 +505,8 @@ async def _discover_krea_models() -> list[DiscoveredModel]:
             ))
 
         # /generate/enhance/{vendor}/{model}
-        enhance_match = re.match(r"^/generate/enhance/([^/]+)/([^/]+)$", path_key)
-        if enhance_match:
-            vendor, model_slug = enhance_match.group(1), enhance_match.group(2)
-            models.append(DiscoveredModel(
+        elif kind == "enhance":
+            models.append(new_model(
                 id=_sanitize_id(f"krea-enhance-{vendor}-{model_slug}"),
                 name=f"{_format_model_name(model_slug, vendor)} (Enhance)",
                 description=summary or f"{vendor} {model_slug} enhancement model",
@@ -413,16 +520,31 @@ async def _discover_krea_models() -> list[DiscoveredModel]:
     return models
 
 
+# fal category -> tag label; categories repeat across hundreds of models, so
+# they share one string instead of a fresh replace() per model
+_fal_category_tags: dict[str, str] = {}
+
+# Returned when fal discovery fails (never cached)
+_FAL_FALLBACK_MODELS: list[DiscoveredModel] = [
+    DiscoveredModel(id="fal-flux-dev", name="FLUX.1 [dev]", description="High-quality image generation", type="image", input_type="text-to-image", model_id="fal-ai/flux/dev", tags=["flux"], provider="fal"),
+    DiscoveredModel(id="fal-flux-schnell", name="FLUX.1 [schnell]", description="Fast image generation", type="image", input_type="text-to-image", model_id="fal-ai/flux/schnell", tags=["flux", "fast"], provider="fal"),
+    DiscoveredModel(id="fal-sdxl", name="Stable Diffusion XL", description="High-resolution synthesis", type="image", input_type="text-to-image", model_id="fal-ai/fast-sdxl", tags=["sdxl"], provider="fal"),
+    DiscoveredModel(id="fal-luma-dream", name="Luma Dream Machine", description="Video generation", type="video", input_type="text-to-video", model_id="fal-ai/luma-dream-machine", tags=["luma"], provider="fal"),
+    DiscoveredModel(id="fal-kling-v2", name="Kling 2.0", description="Kling video generation", type="video", input_type="text-to-video", model_id="fal-ai/kling-video/v2/standard/text-to-video", tags=["kling"], provider="fal"),
+]
+
+
 async def _discover_fal_models(api_key: str) -> list[DiscoveredModel]:
     """Discover models from fal.ai's models API with pagination."""
     models: list[DiscoveredModel] = []
+    # Skip per-item validation; upstream-sourced fields are coerced below
+    new_model = DiscoveredModel.model_construct
     relevant_categories = {
         "text-to-image", "image-to-image", "text-to-video", "image-to-video",
         "video-to-video", "image-editing", "upscaling", "face", "lipsync", "avatar",
     }
 
     try:
-        cursor: str | None = None
         page_count = 0
         max_pages = 20
 
@@ -430,18 +552,30 @@ async def _discover_fal_models(api_key: str) -> list[DiscoveredModel]:
         if api_key:
             headers["Authorization"] = f"Key {api_key}"
 
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            while page_count < max_pages:
-                url = "https://api.fal.ai/v1/models?limit=100&status=active"
-                if cursor:
-                    url += f"&cursor={cursor}"
+        def page_url(cursor: str | None) -> str:
+            url = "https://api.fal.ai/v1/models?limit=100&status=active"
+            return f"{url}&cursor={cursor}" if cursor else url
 
-                response = await client.get(url, headers=headers)
+        client = await _get_client()
+        next_page: asyncio.Task | None = asyncio.create_task(client.get(page_url(None), headers=headers))
+        try:
+            while next_page is not None:
+                response = await next_page
+                next_page = None
                 if not response.is_success:
                     logger.warning(f"fal API error: {response.status_code}")
                     break
 
-                data = response.json()
+                data = orjson.loads(response.content)
+                page_count += 1
+
+                # Prefetch the next page so its round-trip overlaps parsing this one;
+                # sleep(0) lets the task send the request before we start parsing
+                cursor = data.get("next_cursor")
+                if cursor and page_count < max_pages:
+                    next_page = asyncio.create_task(client.get(page_url(cursor), headers=headers))
+                    await asyncio.sleep(0)
+
                 items = data.get("models") or data.get("items") or []
 
                 for model in items:
@@ -478,20 +612,11 @@ async def _discover_fal_models(api_key: str) -> list[DiscoveredModel]:
                             break
 
                     # Refine from endpoint ID patterns
-                    if "edit" in ep_lower:
+                    endpoint_type = _match_fal_endpoint_type(ep_lower)
+                    if endpoint_type == "edit":
                         input_type = "image-to-video" if model_type == "video" else "image-to-image"
-                    elif "img2img" in ep_lower or "image-to-image" in ep_lower:
-                        input_type = "image-to-image"
-                    elif "img2vid" in ep_lower or "image-to-video" in ep_lower:
-                        input_type = "image-to-video"
-                    elif "inpaint" in ep_lower or "outpaint" in ep_lower:
-                        input_type = "image-editing"
-                    elif "upscale" in ep_lower:
-                        input_type = "upscaling"
-                    elif "face" in ep_lower or "faceswap" in ep_lower:
-                        input_type = "face"
-                    elif "lipsync" in ep_lower:
-                        input_type = "lipsync"
+                    elif endpoint_type:
+                        input_type = endpoint_type
 
                     display_name = (
                         meta.get("display_name")
@@ -499,21 +624,25 @@ async def _discover_fal_models(api_key: str) -> list[DiscoveredModel]:
                         or endpoint_id
                     )
 
-                    models.append(DiscoveredModel(
+                    tags = meta.get("tags")
+                    if not tags and category:
+                        category_tag = _fal_category_tags.get(category)
+                        if category_tag is None:
+                            category_tag = _fal_category_tags[category] = category.replace("-", " ")
+                        tags = [category_tag]
+                    models.append(new_model(
                         id=_sanitize_id(f"fal-{endpoint_id}"),
-                        name=display_name,
-                        description=meta.get("description") or f"{display_name} on fal.ai",
+                        name=str(display_name),
+                        description=str(meta.get("description") or f"{display_name} on fal.ai"),
                         type=model_type,
                         input_type=input_type,
                         model_id=endpoint_id,
-                        tags=meta.get("tags") or [category.replace("-", " ")] if category else [],
+                        tags=[str(tag) for tag in tags] if isinstance(tags, list) else [],
                         provider="fal",
                     ))
-
-                cursor = data.get("next_cursor")
-                page_count += 1
-                if not cursor:
-                    break
+        finally:
+            if next_page is not None:
+                next_page.cancel()
 
         logger.info(f"fal discovery: found {len(models)} relevant models")
         return models
@@ -521,13 +650,7 @@ async def _discover_fal_models(api_key: str) -> list[DiscoveredModel]:
     except Exception as e:
         logger.error(f"fal discovery error: {e}")
         # Fallback curated list
-        return [
-            DiscoveredModel(id="fal-flux-dev", name="FLUX.1 [dev]", description="High-quality image generation", type="image", input_type="text-to-image", model_id="fal-ai/flux/dev", tags=["flux"], provider="fal"),
-            DiscoveredModel(id="fal-flux-schnell", name="FLUX.1 [schnell]", description="Fast image generation", type="image", input_type="text-to-image", model_id="fal-ai/flux/schnell", tags=["flux", "fast"], provider="fal"),
-            DiscoveredModel(id="fal-sdxl", name="Stable Diffusion XL", description="High-resolution synthesis", type="image", input_type="text-to-image", model_id="fal-ai/fast-sdxl", tags=["sdxl"], provider="fal"),
-            DiscoveredModel(id="fal-luma-dream", name="Luma Dream Machine", description="Video generation", type="video", input_type="text-to-video", model_id="fal-ai/luma-dream-machine", tags=["luma"], provider="fal"),
-            DiscoveredModel(id="fal-kling-v2", name="Kling 2.0", description="Kling video generation", type="video", input_type="text-to-video", model_id="fal-ai/kling-video/v2/standard/text-to-video", tags=["kling"], provider="fal"),
-        ]
+        return _FAL_FALLBACK_MODELS
 
 
 async def _discover_models(provider_id: str, api_key: str) -> list[DiscoveredModel]:
@@ -539,6 +662,26 @@ async def _discover_models(provider_id: str, api_key: str) -> list[DiscoveredMod
     raise ValueError(f"Discovery not supported for: {provider_id}")
 
 
+# Discovery results per (provider, api key); catalogs change rarely
+_DISCOVERY_TTL = 600.0
+_discovery_cache: dict[tuple[str, str], tuple[float, list[DiscoveredModel]]] = {}
+_discovery_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+async def _discover_models_cached(provider_id: str, api_key: str) -> list[DiscoveredModel]:
+    """Serve discovery from a TTL cache; concurrent misses share one upstream fetch."""
+    key = (provider_id, api_key)
+    async with _discovery_locks[provider_id]:
+        cached = _discovery_cache.get(key)
+        if cached and time.monotonic() - cached[0] < _DISCOVERY_TTL:
+            return cached[1]
+        models = await _discover_models(provider_id, api_key)
+        # Don't pin an empty page or the offline fallback for the whole TTL
+        if models and models is not _FAL_FALLBACK_MODELS:
+            _discovery_cache[key] = (time.monotonic(), models)
+        return models
+
+
 @router.post("/{provider_id}/discover", response_model=DiscoverResponse)
 async def discover_provider_models(provider_id: str):
     """Discover available models from a provider's API."""
@@ -555,13 +698,13 @@ async def discover_provider_models(provider_id: str):
     # Load API key (KREA doesn't need one - public OpenAPI spec)
     api_key = ""
     if provider_id != "krea":
-        data = _load_providers()
+        data = await asyncio.to_thread(_load_providers)
         raw = data.get(provider_id)
         if raw:
             api_key = raw.get("api_key", "")
 
     try:
-        discovered = await _discover_models(provider_id, api_key)
+        discovered = await _discover_models_cached(provider_id, api_key)
         logger.info(f"Discovered {len(discovered)} models for {provider_id}")
         return DiscoverResponse(
             success=True,
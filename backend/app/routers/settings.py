@@ -1,12 +1,39 @@
 """Settings and request logs router."""
-import json
+import asyncio
+import os
+import platform as plat
+import socket
+import sys
+import threading
+from collections import deque
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Literal
-from pydantic import BaseModel
+from typing import Iterable, Iterator, Optional, List, Literal
+import orjson
+from pydantic import BaseModel, TypeAdapter
 from fastapi import APIRouter, Query
 
 from ..utils.paths import get_data_dir
+from ..utils.files import replace_bytes
+from ..utils.json_io import json_bytes
+
+# Optional probes for /system, imported once here rather than per request
+try:
+    import torch
+except ImportError:
+    torch = None
+
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
+
+try:
+    import distro
+except ImportError:
+    distro = None
 
 router = APIRouter(prefix="/api/settings", tags=["settings"])
 
@@ -28,6 +55,10 @@ class RequestLog(BaseModel):
     source_image_urls: Optional[List[str]] = None  # I2I/I2V source images
 
 
+# Validates a whole list of log entries in one call into pydantic-core
+_request_logs_adapter = TypeAdapter(List[RequestLog])
+
+
 class RequestLogsResponse(BaseModel):
     logs: List[RequestLog]
     total: int
@@ -70,76 +101,296 @@ def get_settings_file() -> Path:
 
 
 def get_logs_file() -> Path:
-    """Get the path to the request logs JSON file."""
+    """Get the path to the request logs JSONL file (one record per line, oldest first)."""
+    return get_data_dir() / "request-logs.jsonl"
+
+
+def _legacy_logs_file() -> Path:
+    """Request logs as a single JSON array (newest first), before the JSONL log."""
     return get_data_dir() / "request-logs.json"
 
 
+# Parsed files keyed on st_mtime_ns; reads only stat() unless the file changed
+_settings_cache: Optional[tuple[int, AppSettings]] = None
+# Logs cache also carries the file's record count, live or superseded. Its
+# store is updated in place under _logs_lock
+_logs_cache: Optional[tuple[int, "_LogStore", int]] = None
+
+# Request logs are appended as JSONL records: a full entry (added or updated;
+# the last record for an id wins) or {"id": ..., "deleted": true}. The file is
+# rewritten with only live entries once it holds this many superseded records
+_LOG_COMPACT_SLACK = 256
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Modification time of a file, or None if it doesn't exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
 def load_settings() -> AppSettings:
-    """Load settings from file."""
+    """Load settings from file.
+
+    The returned instance is shared; copy before mutating.
+    """
+    global _settings_cache
     settings_file = get_settings_file()
-    if settings_file.exists():
-        try:
-            with open(settings_file, "r") as f:
-                data = json.load(f)
-                return AppSettings(**data)
-        except Exception:
-            pass
-    return AppSettings()
+    mtime_ns = _mtime_ns(settings_file)
+    if mtime_ns is None:
+        return AppSettings()
+    cached = _settings_cache
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    try:
+        data = orjson.loads(settings_file.read_bytes())
+        settings = AppSettings(**data)
+    except Exception:
+        return AppSettings()
+    _settings_cache = (mtime_ns, settings)
+    return settings
 
 
 def save_settings(settings: AppSettings) -> None:
     """Save settings to file."""
+    global _settings_cache
     settings_file = get_settings_file()
-    with open(settings_file, "w") as f:
-        json.dump(settings.model_dump(), f, indent=2)
+    replace_bytes(settings_file, json_bytes(settings.model_dump(), indent=False))
+    _settings_cache = (settings_file.stat().st_mtime_ns, settings)
+
+
+class _LogStore:
+    """Newest-first request logs, bounded to a max entry count and indexed by id.
+
+    Order is kept as a deque of ids; adds, lookups and updates are O(1).
+    """
+
+    def __init__(self, logs: Iterable[RequestLog], max_entries: int):
+        self._ids: deque[str] = deque(maxlen=max_entries)
+        self._by_id: dict[str, RequestLog] = {}
+        for log in logs:
+            if len(self._ids) == max_entries:
+                break
+            if log.id not in self._by_id:
+                self._ids.append(log.id)
+                self._by_id[log.id] = log
+
+    @property
+    def max_entries(self) -> int:
+        return self._ids.maxlen
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[RequestLog]:
+        by_id = self._by_id
+        return (by_id[log_id] for log_id in self._ids)
+
+    def __reversed__(self) -> Iterator[RequestLog]:
+        by_id = self._by_id
+        return (by_id[log_id] for log_id in reversed(self._ids))
+
+    def get(self, log_id: str) -> Optional[RequestLog]:
+        return self._by_id.get(log_id)
+
+    def page(self, start: int, end: int) -> List[RequestLog]:
+        by_id = self._by_id
+        return [by_id[log_id] for log_id in islice(self._ids, start, end)]
+
+    def add(self, log: RequestLog) -> None:
+        """Add a log as the newest entry, evicting the oldest when full."""
+        if not self._ids.maxlen:
+            return
+        if log.id in self._by_id:
+            self._ids.remove(log.id)
+        elif len(self._ids) == self._ids.maxlen:
+            del self._by_id[self._ids.pop()]
+        self._ids.appendleft(log.id)
+        self._by_id[log.id] = log
+
+    def replace(self, log: RequestLog) -> None:
+        """Swap in a new version of an existing entry, keeping its position."""
+        self._by_id[log.id] = log
+
+    def remove(self, log_id: str) -> bool:
+        """Remove an entry; returns False if it isn't present."""
+        if self._by_id.pop(log_id, None) is None:
+            return False
+        self._ids.remove(log_id)
+        return True
+
+
+def _log_store(logs: Iterable[RequestLog]) -> _LogStore:
+    """Newest-first logs as a store holding at most max_log_entries."""
+    return _LogStore(logs, load_settings().max_log_entries)
+
+
+def _parse_log_records(raw: bytes) -> tuple[_LogStore, int]:
+    """Replay JSONL log records into live entries (newest first) and a record count."""
+    entries: dict[str, dict] = {}
+    records = 0
+    for line in raw.splitlines():
+        if not line:
+            continue
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            continue  # torn final line from an interrupted append
+        records += 1
+        if record.get("deleted"):
+            entries.pop(record["id"], None)
+        else:
+            # Re-assigning an existing key keeps its original position
+            entries[record["id"]] = record
+    # Only entries within max_log_entries are validated into models
+    newest = list(islice(reversed(entries.values()), load_settings().max_log_entries))
+    return _log_store(_request_logs_adapter.validate_python(newest)), records
+
+
+def _read_logs() -> tuple[_LogStore, int]:
+    """Cached (newest-first entries, record count) of the logs file; hold _logs_lock."""
+    global _logs_cache
+    logs_file = get_logs_file()
+    mtime_ns = _mtime_ns(logs_file)
+    if mtime_ns is None:
+        legacy_file = _legacy_logs_file()
+        if not legacy_file.exists():
+            return _LogStore((), 0), 0
+        # One-time migration; the old file is left in place
+        try:
+            logs = _request_logs_adapter.validate_json(legacy_file.read_bytes())
+        except Exception:
+            return _LogStore((), 0), 0
+        save_logs(logs)
+        return _logs_cache[1], _logs_cache[2]
+    cached = _logs_cache
+    if cached is None or cached[0] != mtime_ns:
+        try:
+            logs, records = _parse_log_records(logs_file.read_bytes())
+        except Exception:
+            return _LogStore((), 0), 0
+        cached = _logs_cache = (mtime_ns, logs, records)
+    return cached[1], cached[2]
 
 
 def load_logs() -> List[RequestLog]:
-    """Load request logs from file."""
+    """Load request logs from file (a fresh list of shared, never-mutated entries)."""
+    with _logs_lock:
+        return list(_read_logs()[0])
+
+
+def save_logs(logs) -> None:
+    """Save newest-first request logs to file, rewriting it with only those entries."""
+    global _logs_cache
+    logs = _log_store(logs)
     logs_file = get_logs_file()
-    if logs_file.exists():
-        try:
-            with open(logs_file, "r") as f:
-                data = json.load(f)
-                return [RequestLog(**log) for log in data]
-        except Exception:
-            pass
-    return []
+    replace_bytes(logs_file, b"".join(orjson.dumps(log.model_dump()) + b"\n" for log in reversed(logs)))
+    _logs_cache = (logs_file.stat().st_mtime_ns, logs, len(logs))
 
 
-def save_logs(logs: List[RequestLog]) -> None:
-    """Save request logs to file."""
+def _append_log_records(logs: _LogStore, records: int, new_records: List[dict]) -> None:
+    """Append records to the logs file, compacting instead once enough are superseded.
+
+    ``logs`` is the resulting store of live entries and ``records``
+    the file's record count before the append.
+    """
+    global _logs_cache
+    records += len(new_records)
+    if records - len(logs) > _LOG_COMPACT_SLACK:
+        save_logs(logs)
+        return
     logs_file = get_logs_file()
-    with open(logs_file, "w") as f:
-        json.dump([log.model_dump() for log in logs], f, indent=2)
+    with open(logs_file, "ab") as f:
+        f.write(b"".join(orjson.dumps(record) + b"\n" for record in new_records))
+    _logs_cache = (logs_file.stat().st_mtime_ns, logs, records)
+
+
+# Serializes read-modify-write of the logs file: entries are added by the
+# log writer and download threads and updated from worker threads concurrently
+_logs_lock = threading.Lock()
+
+# Request-log micro-batching: endpoints queue entries and run_log_writer()
+# persists up to _LOG_BATCH_MAX of them per file append, waiting at most
+# _LOG_BATCH_LATENCY_S after the first one
+_LOG_BATCH_MAX = 64
+_LOG_BATCH_LATENCY_S = 0.05
+_log_queue: Optional[asyncio.Queue] = None
+
+
+def add_logs(new_logs: List[RequestLog]) -> None:
+    """Add request log entries (oldest first) with a single append."""
+    with _logs_lock:
+        logs, records = _read_logs()
+        if logs.max_entries != load_settings().max_log_entries:
+            logs = _log_store(logs)
+
+        # Add new logs at the beginning, newest first; the store drops the oldest
+        for log in new_logs:
+            logs.add(log)
+
+        _append_log_records(logs, records, [log.model_dump() for log in new_logs])
 
 
 def add_log(log: RequestLog) -> None:
     """Add a request log entry."""
-    logs = load_logs()
-    settings = load_settings()
+    add_logs([log])
 
-    # Add new log at the beginning
-    logs.insert(0, log)
 
-    # Trim to max entries
-    if len(logs) > settings.max_log_entries:
-        logs = logs[:settings.max_log_entries]
+def queue_log(log: RequestLog) -> None:
+    """Queue a request log entry from the event loop for the batched writer.
 
-    save_logs(logs)
+    Falls back to a direct write when the writer isn't running.
+    """
+    if _log_queue is None:
+        add_log(log)
+    else:
+        _log_queue.put_nowait(log)
+
+
+async def run_log_writer() -> None:
+    """Persist queued request logs in batches until cancelled (app lifespan task)."""
+    global _log_queue
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    _log_queue = queue
+    batch: List[RequestLog] = []
+    try:
+        while True:
+            batch.append(await queue.get())
+            deadline = loop.time() + _LOG_BATCH_LATENCY_S
+            while len(batch) < _LOG_BATCH_MAX:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            flushing, batch = batch, []
+            await asyncio.to_thread(add_logs, flushing)
+    finally:
+        # Flush whatever was still queued at shutdown
+        _log_queue = None
+        while not queue.empty():
+            batch.append(queue.get_nowait())
+        if batch:
+            add_logs(batch)
 
 
 def update_log(log_id: str, updates: dict) -> Optional[RequestLog]:
     """Update a log entry."""
-    logs = load_logs()
-    for i, log in enumerate(logs):
-        if log.id == log_id:
-            log_dict = log.model_dump()
-            log_dict.update(updates)
-            logs[i] = RequestLog(**log_dict)
-            save_logs(logs)
-            return logs[i]
-    return None
+    with _logs_lock:
+        logs, records = _read_logs()
+        log = logs.get(log_id)
+        if log is None:
+            return None
+        log_dict = log.model_dump()
+        log_dict.update(updates)
+        updated = RequestLog(**log_dict)
+        logs.replace(updated)
+        _append_log_records(logs, records, [updated.model_dump()])
+        return updated
 
 
 # ============== Settings Endpoints ==============
@@ -173,20 +424,25 @@ async def get_logs(
     status: Optional[str] = Query(default=None, description="Filter by status"),
 ):
     """Get request logs with pagination."""
-    logs = load_logs()
-
-    # Apply filters
-    if type:
-        logs = [log for log in logs if log.type == type]
-    if status:
-        logs = [log for log in logs if log.status == status]
-
-    total = len(logs)
-
-    # Pagination
     start = (page - 1) * page_size
     end = start + page_size
-    paginated_logs = logs[start:end]
+
+    # Page straight off the cached store; only the returned slice is copied
+    with _logs_lock:
+        logs, _ = _read_logs()
+        if type or status:
+            matches = (
+                log for log in logs
+                if (not type or log.type == type) and (not status or log.status == status)
+            )
+            total = 0
+            paginated_logs = []
+            for total, log in enumerate(matches, 1):
+                if start < total <= end:
+                    paginated_logs.append(log)
+        else:
+            total = len(logs)
+            paginated_logs = logs.page(start, end)
 
     return RequestLogsResponse(
         logs=paginated_logs,
@@ -199,26 +455,25 @@ async def get_logs(
 @router.get("/logs/{log_id}", response_model=RequestLog)
 async def get_log(log_id: str):
     """Get a specific log entry."""
-    logs = load_logs()
-    for log in logs:
-        if log.id == log_id:
-            return log
-    return None
+    with _logs_lock:
+        return _read_logs()[0].get(log_id)
 
 
 @router.delete("/logs")
 async def clear_logs():
     """Clear all request logs."""
-    save_logs([])
+    with _logs_lock:
+        save_logs([])
     return {"status": "cleared"}
 
 
 @router.delete("/logs/{log_id}")
 async def delete_log(log_id: str):
     """Delete a specific log entry."""
-    logs = load_logs()
-    logs = [log for log in logs if log.id != log_id]
-    save_logs(logs)
+    with _logs_lock:
+        logs, records = _read_logs()
+        if logs.remove(log_id):
+            _append_log_records(logs, records, [{"id": log_id, "deleted": True}])
     return {"status": "deleted", "id": log_id}
 
 
@@ -226,8 +481,9 @@ async def delete_log(log_id: str):
 
 def _detect_gpu_via_nvml() -> tuple[bool, str | None, float | None]:
     """Detect GPU using NVML (pynvml/nvidia-ml-py) as fallback when torch.cuda is unavailable."""
+    if pynvml is None:
+        return False, None, None
     try:
-        import pynvml
         pynvml.nvmlInit()
         count = pynvml.nvmlDeviceGetCount()
         if count == 0:
@@ -243,7 +499,6 @@ def _detect_gpu_via_nvml() -> tuple[bool, str | None, float | None]:
             # GB10 / unified-memory SoCs don't support memory queries;
             # fall back to total system RAM (unified memory is shared).
             try:
-                import os
                 page_size = os.sysconf("SC_PAGE_SIZE")
                 page_count = os.sysconf("SC_PHYS_PAGES")
                 memory_gb = round((page_size * page_count) / (1024**3), 2)
@@ -258,10 +513,13 @@ def _detect_gpu_via_nvml() -> tuple[bool, str | None, float | None]:
 @router.get("/system", response_model=SystemInfo)
 async def get_system_info():
     """Get system information."""
-    import sys
-    import socket
-    import platform as plat
+    return await asyncio.to_thread(_probe_system_info)
+
 
+# None of this changes while the server runs; probe torch/NVML/OS once
+@lru_cache(maxsize=1)
+def _probe_system_info() -> SystemInfo:
+    """Detect hardware, OS and torch details."""
     cuda_available = False
     torch_cuda_enabled = False
     gpu_name = None
@@ -271,8 +529,7 @@ async def get_system_info():
     gpu_warning = None
 
     # 1) Try torch.cuda first
-    try:
-        import torch
+    if torch is not None:
         torch_version = torch.__version__
         cuda_available = torch.cuda.is_available()
         torch_cuda_enabled = cuda_available
@@ -280,8 +537,6 @@ async def get_system_info():
             gpu_name = torch.cuda.get_device_name(0)
             gpu_memory_gb = round(torch.cuda.get_device_properties(0).total_memory / (1024**3), 2)
             gpu_detected = True
-    except ImportError:
-        pass
 
     # 2) Fallback: detect GPU via NVML (works even with CPU-only torch)
     if not gpu_detected:
@@ -310,10 +565,9 @@ async def get_system_info():
         os_name = f"macOS {mac_ver}" if mac_ver else "macOS"
     elif system == "linux":
         platform_name = "linux"
-        try:
-            import distro
+        if distro is not None:
             os_name = f"{distro.name()} {distro.version()}"
-        except ImportError:
+        else:
             os_name = f"Linux {plat.release()}"
     elif system == "windows":
         platform_name = "windows"
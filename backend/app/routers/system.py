@@ -1,5 +1,7 @@
 """System resource check endpoints."""
 
+import asyncio
+
 from fastapi import APIRouter, HTTPException
 
 from ..models.schemas import (
@@ -14,7 +16,7 @@ router = APIRouter(prefix="/api", tags=["system"])
 @router.get("/system/status", response_model=SystemResourceStatus)
 async def get_system_status():
     """Get current system resource status."""
-    status = get_system_resources()
+    status = await asyncio.to_thread(get_system_resources)
     return SystemResourceStatus(
         memory_total_gb=round(status.memory_total_gb, 2),
         memory_available_gb=round(status.memory_available_gb, 2),
@@ -34,26 +36,15 @@ async def get_system_status():
 async def check_can_generate(model_id: str):
     """Check if system can run a specific model."""
     service = get_inference_service()
-    model_config = service.get_model_config(model_id)
+    model_spec = service.get_model_spec(model_id)
 
-    if not model_config:
+    if model_spec is None:
         raise HTTPException(status_code=404, detail=f"Model not found: {model_id}")
 
-    # Use memory_gb (actual RAM) if available, otherwise fall back to size_gb (disk size)
-    model_memory_gb = model_config.get("memory_gb") or model_config.get("size_gb", 12)
-    model_name = model_config.get("name", model_id)
-
-    status = check_resources_for_video(model_memory_gb, model_name)
+    status = await asyncio.to_thread(check_resources_for_video, model_spec.memory_gb, model_spec.name)
 
     # Find video models that would fit in current memory
-    recommended = []
-    for mid, mconfig in service.config["models"].items():
-        if mconfig.get("type") in ["video", "ltx2"]:
-            # Use memory_gb if available, otherwise size_gb
-            mem = mconfig.get("memory_gb") or mconfig.get("size_gb", 12)
-            # Required: model + 5GB overhead + 10GB buffer
-            if status.memory_available_gb >= (mem + 5.0 + 10.0):
-                recommended.append(mid)
+    recommended = service.recommended_video_models(status.memory_available_gb)
 
     return ResourceCheckResponse(
         can_generate=status.is_available,
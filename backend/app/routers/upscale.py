@@ -10,6 +10,7 @@ from ..models.schemas import (
 )
 from ..services.upscale_jobs import get_upscale_job_manager
 from ..services.upscaler import get_upscaler_service
+from ..dependencies import JobListQuery
 from ..utils.paths import get_output_dir
 
 router = APIRouter(prefix="/api", tags=["upscale"])
@@ -43,17 +44,12 @@ async def create_upscale_job(request: VideoUpscaleRequest):
     if not model_config:
         raise HTTPException(status_code=400, detail=f"Unknown upscale model: {request.model}")
 
-    # Validate source video exists
-    output_dir = get_output_dir()
-    video_path = output_dir / f"{request.video_asset_id}.mp4"
-    metadata_path = output_dir / f"{request.video_asset_id}.json"
-
+    # Validate source video exists; the metadata sidecar is checked when
+    # create_job reads it, so it isn't stat'ed separately here
+    video_path = get_output_dir() / f"{request.video_asset_id}.mp4"
     if not video_path.exists():
         raise HTTPException(status_code=404, detail=f"Video not found: {request.video_asset_id}")
 
-    if not metadata_path.exists():
-        raise HTTPException(status_code=404, detail=f"Video metadata not found: {request.video_asset_id}")
-
     try:
         upscale_job_manager = get_upscale_job_manager()
         job = upscale_job_manager.create_job(request)
@@ -64,6 +60,8 @@ async def create_upscale_job(request: VideoUpscaleRequest):
             message=f"Upscale job queued. Estimated time: {int(job.eta_seconds or 0)}s",
             eta_seconds=job.eta_seconds,
         )
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -81,18 +79,7 @@ async def get_upscale_job(job_id: str):
 
 
 @router.get("/upscale/jobs", response_model=UpscaleJobListResponse)
-async def list_upscale_jobs(session_id: str = None, active_only: bool = False):
+async def list_upscale_jobs(query: JobListQuery):
     """List upscale jobs, optionally filtered by session or active status."""
-    upscale_job_manager = get_upscale_job_manager()
-
-    if session_id:
-        jobs = upscale_job_manager.get_jobs_by_session(session_id)
-    elif active_only:
-        jobs = upscale_job_manager.get_active_jobs()
-    else:
-        jobs = upscale_job_manager.get_all_jobs()
-
-    # Sort by created_at descending
-    jobs = sorted(jobs, key=lambda j: j.created_at, reverse=True)
-
-    return UpscaleJobListResponse(jobs=jobs)
+    # Newest first, read from the manager's creation-order index
+    return UpscaleJobListResponse(jobs=get_upscale_job_manager().list_jobs(**query))
@@ -1,6 +1,6 @@
 """Video generation job endpoints."""
 
-from datetime import datetime
+import asyncio
 
 from fastapi import APIRouter, HTTPException
 
@@ -11,7 +11,9 @@ from ..models.schemas import (
 from ..services.inference import get_inference_service
 from ..services.video_jobs import get_video_job_manager
 from ..services.resources import check_resources_for_video
-from .settings import add_log, RequestLog
+from ..dependencies import JobListQuery
+from ..utils.clock import now_iso
+from .settings import queue_log, RequestLog
 
 router = APIRouter(prefix="/api", tags=["video"])
 
@@ -22,18 +24,15 @@ async def create_video_job(request: VideoGenerateRequest):
     service = get_inference_service()
 
     # Validate model exists and is a video model
-    model_config = service.get_model_config(request.model)
-    if not model_config:
+    model_spec = service.get_model_spec(request.model)
+    if model_spec is None:
         raise HTTPException(status_code=400, detail=f"Unknown model: {request.model}")
 
-    if model_config.get("type") not in ["video", "ltx2", "wan", "mochi"]:
+    if model_spec.type not in ["video", "ltx2", "wan", "mochi"]:
         raise HTTPException(status_code=400, detail=f"Model {request.model} is not a video model")
 
     # Check system resources before accepting job
-    # Use memory_gb (actual RAM) if available, otherwise fall back to size_gb (disk size)
-    model_memory_gb = model_config.get("memory_gb") or model_config.get("size_gb", 12)
-    model_name = model_config.get("name", request.model)
-    resource_status = check_resources_for_video(model_memory_gb, model_name)
+    resource_status = await asyncio.to_thread(check_resources_for_video, model_spec.memory_gb, model_spec.name)
 
     if not resource_status.is_available:
         raise HTTPException(
@@ -53,10 +52,10 @@ async def create_video_job(request: VideoGenerateRequest):
     video_job_manager = get_video_job_manager()
     job = video_job_manager.create_job(request)
 
-    # Log the request
+    # Log the request (persisted in batches by the log writer)
     log_entry = RequestLog(
         id=job.id,
-        timestamp=datetime.now().isoformat(),
+        timestamp=now_iso(),
         type="video",
         prompt=request.prompt,
         negative_prompt=request.negative_prompt,
@@ -72,7 +71,7 @@ async def create_video_job(request: VideoGenerateRequest):
         },
         status="pending",
     )
-    add_log(log_entry)
+    queue_log(log_entry)
 
     return VideoJobResponse(
         job_id=job.id,
@@ -94,18 +93,7 @@ async def get_video_job(job_id: str):
 
 
 @router.get("/video/jobs", response_model=VideoJobListResponse)
-async def list_video_jobs(session_id: str = None, active_only: bool = False):
+async def list_video_jobs(query: JobListQuery):
     """List video jobs, optionally filtered by session or active status."""
-    video_job_manager = get_video_job_manager()
-
-    if session_id:
-        jobs = video_job_manager.get_jobs_by_session(session_id)
-    elif active_only:
-        jobs = video_job_manager.get_active_jobs()
-    else:
-        jobs = list(video_job_manager.jobs.values())
-
-    # Sort by created_at descending
-    jobs = sorted(jobs, key=lambda j: j.created_at, reverse=True)
-
-    return VideoJobListResponse(jobs=jobs)
+    # Newest first, read from the manager's creation-order index
+    return VideoJobListResponse(jobs=get_video_job_manager().list_jobs(**query))
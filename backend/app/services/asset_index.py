@@ -0,0 +1,163 @@
+"""SQLite index over the asset metadata sidecars in the outputs directory.
+
+The JSON sidecars stay the source of truth (every generator writes them and
+external tools read them). This index mirrors them in a WAL-mode SQLite
+table so gallery listing is an indexed, paginated query instead of parsing
+every sidecar on each request. Each sidecar is parsed once, when it first
+appears or changes on disk.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import orjson
+
+from ..models.schemas import AssetMetadata, VideoAssetMetadata
+from ..utils.paths import get_data_dir
+
+logger = logging.getLogger(__name__)
+
+ASSET_KIND_IMAGE = "image"
+ASSET_KIND_VIDEO = "video"
+# Unparseable or incomplete sidecars are remembered so they aren't re-read
+ASSET_KIND_INVALID = "invalid"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    batch_id TEXT,
+    model TEXT,
+    created_at TEXT,
+    mtime REAL NOT NULL,
+    meta_json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_assets_kind_mtime ON assets(kind, mtime DESC);
+CREATE INDEX IF NOT EXISTS ix_assets_batch ON assets(batch_id);
+"""
+
+
+def _classify(data: dict, path: str) -> str:
+    """Decide which listing a sidecar belongs to, validating it the way the assets router does."""
+    try:
+        probe = {
+            **data,
+            "url": f"/outputs/{data['filename']}",
+            "created_at": datetime.fromisoformat(data["created_at"]),
+        }
+        if data.get("type") == "video":
+            VideoAssetMetadata(**probe)
+            return ASSET_KIND_VIDEO
+        AssetMetadata(**probe)
+        return ASSET_KIND_IMAGE
+    except (KeyError, TypeError, ValueError) as e:  # pydantic's ValidationError is a ValueError
+        logger.warning(f"Invalid asset metadata in {path}: {e}")
+        return ASSET_KIND_INVALID
+
+
+class AssetIndex:
+    """Metadata index kept in sync with the sidecars in an outputs directory."""
+
+    def __init__(self, db_path: Path):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        # In-memory mirror of (id -> sidecar mtime) so sync never re-reads the table
+        self._mtimes: dict[str, float] = dict(self._conn.execute("SELECT id, mtime FROM assets"))
+
+    def sync(self, output_dir: Path) -> None:
+        """Index new or modified sidecars and drop rows whose sidecar is gone."""
+        seen: dict[str, tuple[str, float]] = {}
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    try:
+                        seen[entry.name[:-5]] = (entry.path, entry.stat().st_mtime)
+                    except FileNotFoundError:
+                        continue
+
+        with self._lock:
+            changed = [
+                (asset_id, path, mtime) for asset_id, (path, mtime) in seen.items()
+                if self._mtimes.get(asset_id) != mtime
+            ]
+            removed = [asset_id for asset_id in self._mtimes if asset_id not in seen]
+            if not changed and not removed:
+                return
+
+            rows = []
+            for asset_id, path, mtime in changed:
+                try:
+                    raw = Path(path).read_bytes()
+                    data = orjson.loads(raw)
+                    if not isinstance(data, dict):
+                        logger.warning(f"Invalid asset metadata in {path}: not a JSON object")
+                        data, kind = {}, ASSET_KIND_INVALID
+                    else:
+                        kind = _classify(data, path)
+                except (OSError, orjson.JSONDecodeError) as e:
+                    logger.warning(f"Failed to read asset metadata {path}: {e}")
+                    data, raw, kind = {}, b"{}", ASSET_KIND_INVALID
+                rows.append((
+                    asset_id, kind, data.get("batch_id"), data.get("model"), data.get("created_at"),
+                    mtime, raw.decode("utf-8", errors="replace"),
+                ))
+
+            # One transaction for the whole batch of changes
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO assets (id, kind, batch_id, model, created_at, mtime, meta_json) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.executemany("DELETE FROM assets WHERE id = ?", [(asset_id,) for asset_id in removed])
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+            for row in rows:
+                self._mtimes[row[0]] = row[5]
+            for asset_id in removed:
+                del self._mtimes[asset_id]
+
+    def page(self, kind: str, limit: int, offset: int, model: Optional[str] = None) -> tuple[list[dict], int]:
+        """Return (metadata dicts newest first, total count) for one asset kind."""
+        where = "kind = ?"
+        params: list = [kind]
+        if model:
+            where += " AND model = ?"
+            params.append(model)
+        with self._lock:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM assets WHERE {where}", params).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT meta_json FROM assets WHERE {where} ORDER BY mtime DESC LIMIT ? OFFSET ?",
+                [*params, limit, offset],
+            ).fetchall()
+        return [orjson.loads(meta_json) for (meta_json,) in rows], total
+
+    def remove(self, asset_id: str) -> None:
+        """Drop an asset right away (e.g. after its files were deleted)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM assets WHERE id = ?", (asset_id,))
+            self._mtimes.pop(asset_id, None)
+
+
+# Global singleton
+_asset_index: Optional[AssetIndex] = None
+
+
+def get_asset_index() -> AssetIndex:
+    """Get the global asset index instance."""
+    global _asset_index
+    if _asset_index is None:
+        _asset_index = AssetIndex(get_data_dir() / "assets.db")
+    return _asset_index
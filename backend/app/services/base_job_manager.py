@@ -1,22 +1,69 @@
 """Base job manager with shared infrastructure for all job types.
 
-Provides generic persistence, queue management, worker thread,
-and CRUD operations. Concrete subclasses only need to implement
+Provides generic persistence, queue management, a worker on the shared
+job thread pool, and CRUD operations. Concrete subclasses only need to implement
 _process_job() and type-specific job creation methods.
 """
 
-import json
+import asyncio
+import os
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
 from datetime import datetime
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
-from typing import TypeVar, Generic, Optional, Dict, Type
-from queue import Queue
+from types import MappingProxyType
+from typing import Any, Coroutine, Mapping, NamedTuple, TypeVar, Generic, Optional, Dict, Type
+from queue import Empty, Queue
+
+import orjson
 
 from ..models.schemas import JobStatus
 from ..utils.paths import get_data_dir
+from ..utils.files import replace_bytes
+from ..utils.cpu_affinity import inference_cores, pin_current_thread
 
 T = TypeVar("T")
 
+# Changes are appended to a JSONL journal next to the jobs file; once it holds
+# this many records the full jobs file is rewritten and the journal truncated
+JOURNAL_COMPACT_RECORDS = 500
+
+_DATETIME_FIELDS = ("created_at", "started_at", "completed_at")
+
+# Every job manager drains its queue on this pool instead of parking a
+# dedicated thread on it. Threads are started only when a queue has work;
+# at least one per manager so a long job never holds up another queue.
+JOB_WORKER_THREADS = max(8, os.cpu_count() or 1)
+_job_executor = ThreadPoolExecutor(max_workers=JOB_WORKER_THREADS, thread_name_prefix="job-worker")
+
+# Long-lived event loop for async job processing, started on first use
+_job_loop: Optional[asyncio.AbstractEventLoop] = None
+_job_loop_lock = threading.Lock()
+
+
+def _get_job_loop() -> asyncio.AbstractEventLoop:
+    global _job_loop
+    with _job_loop_lock:
+        if _job_loop is None:
+            _job_loop = asyncio.new_event_loop()
+            threading.Thread(target=_job_loop.run_forever, name="job-loop", daemon=True).start()
+        return _job_loop
+
+
+class _JobsView(NamedTuple):
+    """Immutable copy of a manager's jobs and indexes, published for lock-free reads."""
+
+    jobs: Mapping[str, Any]
+    order: tuple[str, ...]
+    by_session: Mapping[str, tuple[str, ...]]
+    active: frozenset[str]
+
+
+_EMPTY_VIEW = _JobsView(MappingProxyType({}), (), MappingProxyType({}), frozenset())
+
 
 class BaseJobManager(Generic[T]):
     """Generic base class for all job managers.
@@ -34,88 +81,275 @@ class BaseJobManager(Generic[T]):
 
     def __init__(self):
         self.jobs: Dict[str, T] = {}
+        # Secondary indexes (guarded by self.lock) so listing doesn't scan every job
+        self._order: list[str] = []  # job IDs in creation order
+        self._by_session: Dict[str, list[str]] = defaultdict(list)
+        self._active: set[str] = set()  # IDs of jobs not yet completed/failed
+        # Copy of the above that getters read without taking the lock. Writers
+        # replace it whole under the lock whenever a job is added or removed or
+        # changes status; field updates mutate the shared job objects in place.
+        self._view: _JobsView = _EMPTY_VIEW
+        # Jobs changed (or removed) since the last _save_jobs(), and the number
+        # of records in the journal since the last compaction
+        self._dirty: set[str] = set()
+        self._journal_records = 0
+        # Encoded JSON of each job as of its last save; valid while it isn't dirty
+        self._encoded: dict[str, bytes] = {}
         self.job_queue: Queue = Queue()
         self.current_job_id: Optional[str] = None
         self.lock = threading.Lock()
+        # Whether a drain of job_queue is scheduled or running on the pool;
+        # guarded by _drain_lock so jobs are processed one at a time
+        self._draining = False
+        self._drain_lock = threading.Lock()
         self._load_jobs()
+        self._publish()
 
-        # Start worker thread
-        self.worker_thread = threading.Thread(target=self._worker, daemon=True)
-        self.worker_thread.start()
+        # Pick up jobs re-queued from the last run
+        if self._has_pending():
+            self._schedule_drain()
 
     def _get_jobs_file(self) -> Path:
         return get_data_dir() / self._jobs_filename
 
+    def _get_journal_file(self) -> Path:
+        return self._get_jobs_file().with_suffix(".jsonl")
+
     def _load_jobs(self) -> None:
-        """Load jobs from file on startup."""
+        """Load jobs from file on startup, replaying the journal over the last snapshot."""
         jobs_file = self._get_jobs_file()
-        if jobs_file.exists():
-            try:
-                with open(jobs_file, "r") as f:
-                    data = json.load(f)
-                    for job_data in data.get("jobs", []):
-                        # Convert datetime strings
-                        for dt_field in ["created_at", "started_at", "completed_at"]:
-                            if job_data.get(dt_field):
-                                job_data[dt_field] = datetime.fromisoformat(job_data[dt_field])
-                        job = self._job_type(**job_data)
-                        # Only keep recent jobs (last 24 hours) or incomplete ones
-                        if job.status not in [JobStatus.COMPLETED, JobStatus.FAILED]:
-                            # Re-queue incomplete jobs
-                            job.status = JobStatus.QUEUED
-                            self.jobs[job.id] = job
-                            self.job_queue.put(job.id)
-                        elif job.created_at and (datetime.utcnow() - job.created_at).total_seconds() < 86400:
-                            self.jobs[job.id] = job
-            except Exception as e:
-                print(f"Failed to load {self._worker_name.lower()} jobs: {e}")
+        journal_file = self._get_journal_file()
+        try:
+            records: dict[str, dict] = {}
+            if jobs_file.exists():
+                data = orjson.loads(jobs_file.read_bytes())
+                for job_data in data.get("jobs", []):
+                    records[job_data["id"]] = job_data
+            replayed = 0
+            if journal_file.exists():
+                for line in journal_file.read_bytes().splitlines():
+                    try:
+                        record = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        continue  # torn final line from an interrupted append
+                    replayed += 1
+                    if record.get("_deleted"):
+                        records.pop(record["id"], None)
+                    else:
+                        # Re-assigning an existing key keeps creation order
+                        records[record["id"]] = record
+
+            for job_data in records.values():
+                # Convert datetime strings
+                for dt_field in _DATETIME_FIELDS:
+                    if job_data.get(dt_field):
+                        job_data[dt_field] = datetime.fromisoformat(job_data[dt_field])
+                job = self._job_type(**job_data)
+                # Only keep recent jobs (last 24 hours) or incomplete ones
+                if job.status not in [JobStatus.COMPLETED, JobStatus.FAILED]:
+                    # Re-queue incomplete jobs
+                    job.status = JobStatus.QUEUED
+                    self._add_job(job, publish=False)
+                    self.job_queue.put(job.id)
+                elif job.created_at and (datetime.utcnow() - job.created_at).total_seconds() < 86400:
+                    self._add_job(job, publish=False)
+            self._dirty.clear()
+
+            # Fold the replayed journal into a fresh snapshot
+            if replayed:
+                with self.lock:
+                    self._compact_jobs()
+        except Exception as e:
+            print(f"Failed to load {self._worker_name.lower()} jobs: {e}")
+
+    def _encode_job(self, job_id: str) -> bytes:
+        """Encode a job's current state and cache it. Caller must hold self.lock.
+
+        orjson writes datetimes as ISO 8601 strings itself, matching isoformat().
+        """
+        data = self._encoded[job_id] = orjson.dumps(self.jobs[job_id].model_dump())
+        return data
 
     def _save_jobs(self) -> None:
-        """Save jobs to file. File write is inside the lock to prevent race conditions."""
-        jobs_file = self._get_jobs_file()
+        """Persist jobs changed since the last save. File writes are inside the lock.
+
+        Each changed job is appended to the journal as one line (removed jobs
+        as a tombstone); the full jobs file is only rewritten on compaction.
+        """
         with self.lock:
-            jobs_data = []
-            for job in self.jobs.values():
-                job_dict = job.model_dump()
-                # Convert datetime to ISO format
-                for dt_field in ["created_at", "started_at", "completed_at"]:
-                    if job_dict.get(dt_field):
-                        job_dict[dt_field] = job_dict[dt_field].isoformat()
-                jobs_data.append(job_dict)
-
-            with open(jobs_file, "w") as f:
-                json.dump({"jobs": jobs_data}, f, indent=2)
+            if not self._dirty:
+                return
+            if self._journal_records + len(self._dirty) > JOURNAL_COMPACT_RECORDS:
+                self._compact_jobs()
+                return
+            lines = []
+            for job_id in self._dirty:
+                if job_id in self.jobs:
+                    lines.append(self._encode_job(job_id))
+                else:
+                    self._encoded.pop(job_id, None)
+                    lines.append(orjson.dumps({"id": job_id, "_deleted": True}))
+            with open(self._get_journal_file(), "ab") as f:
+                f.write(b"\n".join(lines) + b"\n")
+            self._journal_records += len(lines)
+            self._dirty.clear()
+
+    def _compact_jobs(self) -> None:
+        """Rewrite the full jobs file atomically and truncate the journal. Caller must hold self.lock."""
+        # Only jobs changed since their last save are re-dumped and re-encoded
+        for job_id in self._dirty:
+            if job_id not in self.jobs:
+                self._encoded.pop(job_id, None)
+        encoded = self._encoded
+        jobs_data = b",".join(
+            encoded[job_id] if job_id in encoded and job_id not in self._dirty else self._encode_job(job_id)
+            for job_id in self.jobs
+        )
+        replace_bytes(self._get_jobs_file(), b'{"jobs":[' + jobs_data + b"]}")
+        # The snapshot already holds everything the journal recorded; replaying
+        # a journal left behind by a crash here is harmless
+        open(self._get_journal_file(), "wb").close()
+        self._journal_records = 0
+        self._dirty.clear()
+
+    def _publish(self) -> None:
+        """Rebuild the lock-free read view from the jobs and indexes. Caller must hold self.lock."""
+        self._view = _JobsView(
+            MappingProxyType(dict(self.jobs)),
+            tuple(self._order),
+            MappingProxyType({sid: tuple(ids) for sid, ids in self._by_session.items()}),
+            frozenset(self._active),
+        )
+
+    def _add_job(self, job: T, publish: bool = True) -> None:
+        """Insert a job and index it. Caller must hold self.lock."""
+        self.jobs[job.id] = job
+        self._dirty.add(job.id)
+        self._order.append(job.id)
+        if job.session_id:
+            self._by_session[job.session_id].append(job.id)
+        if job.status not in [JobStatus.COMPLETED, JobStatus.FAILED]:
+            self._active.add(job.id)
+        if publish:
+            self._publish()
+
+    def _remove_job(self, job_id: str) -> None:
+        """Remove a job and its index entries. Caller must hold self.lock."""
+        job = self.jobs.pop(job_id, None)
+        if job is None:
+            return
+        self._dirty.add(job_id)
+        self._order.remove(job_id)
+        if job.session_id:
+            session_ids = self._by_session.get(job.session_id)
+            if session_ids:
+                session_ids.remove(job_id)
+                if not session_ids:
+                    del self._by_session[job.session_id]
+        self._active.discard(job_id)
+        self._publish()
 
     def get_job(self, job_id: str) -> Optional[T]:
         """Get a job by ID."""
-        with self.lock:
-            return self.jobs.get(job_id)
+        return self._view.jobs.get(job_id)
 
     def get_jobs_by_session(self, session_id: str) -> list[T]:
         """Get all jobs for a session."""
-        with self.lock:
-            return [j for j in self.jobs.values() if j.session_id == session_id]
+        view = self._view
+        return [view.jobs[jid] for jid in view.by_session.get(session_id, ())]
 
     def get_active_jobs(self) -> list[T]:
         """Get all active (non-completed) jobs."""
-        with self.lock:
-            return [j for j in self.jobs.values()
-                    if j.status not in [JobStatus.COMPLETED, JobStatus.FAILED]]
+        view = self._view
+        return [view.jobs[jid] for jid in view.active]
+
+    def list_jobs(
+        self,
+        session_id: Optional[str] = None,
+        active_only: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> list[T]:
+        """List jobs newest first, optionally filtered by session or active status.
+
+        Reads the creation-order indexes of the published view without the
+        lock, so the cost is bounded by offset + limit rather than by the
+        total number of jobs.
+        """
+        stop = offset + limit if limit is not None else None
+        view = self._view
+        if active_only and not session_id:
+            # The active set is small; sort it with a C-level key
+            active = sorted((view.jobs[jid] for jid in view.active), key=attrgetter("created_at"), reverse=True)
+            return active[offset:stop]
+        if session_id:
+            ids = reversed(view.by_session.get(session_id, ()))
+        else:
+            ids = reversed(view.order)
+        return [view.jobs[jid] for jid in islice(ids, offset, stop)]
 
     def _update_job(self, job_id: str, **updates) -> None:
         """Update job fields."""
+        self._update_jobs([job_id], **updates)
+
+    def _update_jobs(self, job_ids: list[str], **updates) -> None:
+        """Apply the same field updates to several jobs with a single save."""
         with self.lock:
-            if job_id in self.jobs:
+            for job_id in job_ids:
+                if job_id not in self.jobs:
+                    continue
                 job = self.jobs[job_id]
                 for key, value in updates.items():
                     setattr(job, key, value)
+                self._dirty.add(job_id)
+                if "status" in updates:
+                    if job.status in [JobStatus.COMPLETED, JobStatus.FAILED]:
+                        self._active.discard(job_id)
+                    else:
+                        self._active.add(job_id)
+            if "status" in updates and self._view.active != self._active:
+                self._view = self._view._replace(active=frozenset(self._active))
         self._save_jobs()
 
+    def _enqueue(self, job_id: str) -> None:
+        """Queue a job and make sure a drain is scheduled to run it."""
+        self.job_queue.put(job_id)
+        self._schedule_drain()
+
+    def _schedule_drain(self) -> None:
+        with self._drain_lock:
+            if self._draining:
+                return
+            self._draining = True
+        _job_executor.submit(self._run_worker)
+
+    def _has_pending(self) -> bool:
+        """Whether queued work remains for the worker."""
+        return not self.job_queue.empty()
+
+    def _run_worker(self) -> None:
+        """Pool entry point: keep inference off the event loop's cores, drain the queue."""
+        pin_current_thread(inference_cores())
+        while True:
+            try:
+                self._worker()
+            except Exception as e:
+                print(f"{self._worker_name} error: {e}")
+            # A job queued after _worker() saw an empty queue but before this
+            # check is picked up here; one queued after it schedules a new drain
+            with self._drain_lock:
+                if not self._has_pending():
+                    self._draining = False
+                    return
+
     def _worker(self) -> None:
-        """Background worker that processes jobs."""
+        """Process queued jobs until the queue is empty."""
         while True:
             try:
-                job_id = self.job_queue.get()
+                job_id = self.job_queue.get_nowait()
+            except Empty:
+                return
+            try:
                 self.current_job_id = job_id
                 self._process_job(job_id)
                 self.current_job_id = None
@@ -127,6 +361,14 @@ class BaseJobManager(Generic[T]):
                                     error=str(e))
                 self.current_job_id = None
 
+    def _run_async(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Run a coroutine on the shared job event loop and block until it finishes.
+
+        Managers whose jobs are async share one loop instead of creating and
+        closing one per job; jobs from different managers overlap their I/O there.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, _get_job_loop()).result()
+
     def _process_job(self, job_id: str) -> None:
         """Process a single job. Must be implemented by subclasses."""
         raise NotImplementedError("Subclasses must implement _process_job()")
@@ -1,7 +1,6 @@
 """Bulk job manager for batch image generation via fal.ai."""
 
 import asyncio
-import json
 import uuid
 import logging
 from datetime import datetime
@@ -10,17 +9,28 @@ from typing import Optional
 
 from ..models.schemas import BulkJob, BulkImageItem, JobStatus
 from ..utils.paths import get_output_dir
+from ..utils.files import write_bytes
+from ..utils.images import image_io_executor
+from ..utils.json_io import json_bytes
 from .base_job_manager import BaseJobManager
 from . import fal_client
 
 logger = logging.getLogger(__name__)
 
 
+# fal.ai renders remotely, so a job's items can overlap their HTTP round-trips
+DEFAULT_MAX_CONCURRENCY = 4
+
+
 class BulkJobManager(BaseJobManager[BulkJob]):
     _jobs_filename = "bulk_jobs.json"
     _job_type = BulkJob
     _worker_name = "Bulk worker"
 
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        self.max_concurrency = max_concurrency
+        super().__init__()
+
     def create_job(
         self,
         prompts: list[str],
@@ -57,9 +67,9 @@ class BulkJobManager(BaseJobManager[BulkJob]):
         )
 
         with self.lock:
-            self.jobs[job.id] = job
+            self._add_job(job)
 
-        self.job_queue.put(job.id)
+        self._enqueue(job.id)
         self._save_jobs()
 
         logger.info(f"Created bulk job {job_id} with {len(prompts)} prompts")
@@ -75,22 +85,17 @@ class BulkJobManager(BaseJobManager[BulkJob]):
                 job.status = JobStatus.FAILED
                 job.error = "Cancelled by user"
                 job.completed_at = datetime.utcnow()
-            del self.jobs[job_id]
+            self._remove_job(job_id)
         self._save_jobs()
         return True
 
     def _process_job(self, job_id: str) -> None:
-        """Process a bulk job by generating images sequentially."""
+        """Process a bulk job, generating up to max_concurrency images at a time."""
         job = self.get_job(job_id)
         if not job:
             return
 
-        # Run async processing in a new event loop (we're in a worker thread)
-        loop = asyncio.new_event_loop()
-        try:
-            loop.run_until_complete(self._process_job_async(job_id))
-        finally:
-            loop.close()
+        self._run_async(self._process_job_async(job_id))
 
     async def _process_job_async(self, job_id: str) -> None:
         """Async implementation of bulk job processing."""
@@ -105,86 +110,101 @@ class BulkJobManager(BaseJobManager[BulkJob]):
             return
 
         output_dir = get_output_dir()
+        # Item changes are persisted with the progress update, and only
+        # when progress reaches a new whole percent
+        last_saved_progress = -1
+        semaphore = asyncio.Semaphore(self.max_concurrency)
 
-        for i, item in enumerate(job.items):
-            # Check if job was cancelled
+        def cancelled() -> bool:
             current_job = self.get_job(job_id)
-            if not current_job or current_job.status == JobStatus.FAILED:
-                return
-
-            # Update item status
-            with self.lock:
-                if job_id in self.jobs:
-                    self.jobs[job_id].items[i].status = "generating"
-            self._save_jobs()
-
-            try:
-                # Generate image via fal.ai
-                result = await fal_client.generate_image(
-                    prompt=item.prompt,
-                    model_id=job.fal_model,
-                    width=job.width,
-                    height=job.height,
-                    steps=job.steps,
-                )
-
-                # Download the generated image
-                image_data = await fal_client.download_image(result["image_url"])
-
-                # Save to outputs/
-                asset_id = str(uuid.uuid4())
-                ext = "png"
-                if result.get("content_type", "").endswith("jpeg"):
-                    ext = "jpg"
-                image_path = output_dir / f"{asset_id}.{ext}"
-                metadata_path = output_dir / f"{asset_id}.json"
-
-                with open(image_path, "wb") as f:
-                    f.write(image_data)
-
-                metadata = {
-                    "id": asset_id,
-                    "filename": f"{asset_id}.{ext}",
-                    "prompt": item.prompt,
-                    "negative_prompt": None,
-                    "model": f"fal:{job.fal_model}",
-                    "width": job.width,
-                    "height": job.height,
-                    "steps": job.steps or 0,
-                    "guidance_scale": 0,
-                    "seed": result.get("seed") or 0,
-                    "batch_id": job_id,
-                    "created_at": datetime.utcnow().isoformat(),
-                }
-
-                with open(metadata_path, "w") as f:
-                    json.dump(metadata, f, indent=2)
-
-                # Update item as completed
-                with self.lock:
-                    if job_id in self.jobs:
-                        self.jobs[job_id].items[i].status = "completed"
-                        self.jobs[job_id].items[i].image_url = f"/outputs/{asset_id}.{ext}"
-                        self.jobs[job_id].items[i].asset_id = asset_id
-                        self.jobs[job_id].items[i].seed = result.get("seed")
-                        self.jobs[job_id].completed += 1
+            return not current_job or current_job.status == JobStatus.FAILED
 
-                logger.info(f"Bulk job {job_id}: completed image {i + 1}/{job.total}")
+        async def process_item(i: int, item: BulkImageItem) -> None:
+            nonlocal last_saved_progress
+            async with semaphore:
+                # Check if job was cancelled
+                if cancelled():
+                    return
 
-            except Exception as e:
-                logger.error(f"Bulk job {job_id}: image {i} failed: {e}")
+                # Update item status (in memory only; saved with the next progress update)
                 with self.lock:
                     if job_id in self.jobs:
-                        self.jobs[job_id].items[i].status = "failed"
-                        self.jobs[job_id].items[i].error = str(e)
-                        self.jobs[job_id].failed += 1
-
-            # Update overall progress
-            current = self.get_job(job_id)
-            if current:
-                done = current.completed + current.failed
-                progress = (done / current.total) * 100 if current.total > 0 else 0
-                self._update_job(job_id, progress=progress)
+                        self.jobs[job_id].items[i].status = "generating"
+                        self._dirty.add(job_id)
+
+                try:
+                    # Generate image via fal.ai
+                    result = await fal_client.generate_image(
+                        prompt=item.prompt,
+                        model_id=job.fal_model,
+                        width=job.width,
+                        height=job.height,
+                        steps=job.steps,
+                    )
+
+                    # Save to outputs/
+                    asset_id = str(uuid.uuid4())
+                    ext = "png"
+                    if result.get("content_type", "").endswith("jpeg"):
+                        ext = "jpg"
+                    image_path = output_dir / f"{asset_id}.{ext}"
+                    metadata_path = output_dir / f"{asset_id}.json"
+
+                    metadata = {
+                        "id": asset_id,
+                        "filename": f"{asset_id}.{ext}",
+                        "prompt": item.prompt,
+                        "negative_prompt": None,
+                        "model": f"fal:{job.fal_model}",
+                        "width": job.width,
+                        "height": job.height,
+                        "steps": job.steps or 0,
+                        "guidance_scale": 0,
+                        "seed": result.get("seed") or 0,
+                        "batch_id": job_id,
+                        "created_at": datetime.utcnow().isoformat(),
+                    }
+
+                    # Stream the generated image to disk, then write its metadata off this loop
+                    await fal_client.download_image_to_path(result["image_url"], image_path)
+                    await asyncio.get_running_loop().run_in_executor(
+                        image_io_executor, write_bytes, metadata_path, json_bytes(metadata),
+                    )
+
+                    # Update item as completed
+                    with self.lock:
+                        if job_id in self.jobs:
+                            self.jobs[job_id].items[i].status = "completed"
+                            self.jobs[job_id].items[i].image_url = f"/outputs/{asset_id}.{ext}"
+                            self.jobs[job_id].items[i].asset_id = asset_id
+                            self.jobs[job_id].items[i].seed = result.get("seed")
+                            self.jobs[job_id].completed += 1
+                            self._dirty.add(job_id)
+
+                    logger.info(f"Bulk job {job_id}: completed image {i + 1}/{job.total}")
+
+                except Exception as e:
+                    logger.error(f"Bulk job {job_id}: image {i} failed: {e}")
+                    with self.lock:
+                        if job_id in self.jobs:
+                            self.jobs[job_id].items[i].status = "failed"
+                            self.jobs[job_id].items[i].error = str(e)
+                            self.jobs[job_id].failed += 1
+                            self._dirty.add(job_id)
+
+                # Update overall progress
+                current = self.get_job(job_id)
+                if current:
+                    done = current.completed + current.failed
+                    progress = (done / current.total) * 100 if current.total > 0 else 0
+                    if int(progress) != last_saved_progress:
+                        last_saved_progress = int(progress)
+                        self._update_job(job_id, progress=progress)
+
+        # Items run concurrently, bounded by the semaphore
+        await asyncio.gather(*(process_item(i, item) for i, item in enumerate(job.items)))
+        if cancelled():
+            return
 
         # Mark job as completed
         self._update_job(
@@ -1,7 +1,10 @@
+import asyncio
 import httpx
+import orjson
 import time
 import logging
-from typing import Optional
+from collections import OrderedDict
+from typing import Awaitable, Callable, Hashable, Optional
 
 
 CIVITAI_API_BASE = "https://civitai.com/api/v1"
@@ -10,6 +13,7 @@ CIVITAI_API_BASE = "https://civitai.com/api/v1"
 SEARCH_CACHE_TTL = 300  # 5 minutes for search results
 MODEL_CACHE_TTL = 900   # 15 minutes for individual model details
 MAX_CACHE_ENTRIES = 200  # Prevent unbounded memory growth
+STALE_SWEEP_INTERVAL = 64  # Inserts between full sweeps for expired entries
 
 logger = logging.getLogger(__name__)
 
@@ -22,9 +26,12 @@ class CivitaiClient:
             follow_redirects=True,
         )
         self._update_auth()
-        # In-memory response cache: key -> (timestamp, data)
-        self._search_cache: dict[str, tuple[float, dict]] = {}
-        self._model_cache: dict[int, tuple[float, dict]] = {}
+        # In-memory LRU response caches: key -> (timestamp, data), least recently used first
+        self._search_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._model_cache: OrderedDict[int, tuple[float, dict]] = OrderedDict()
+        self._cache_inserts = 0
+        # Upstream calls in flight, so concurrent misses for one key share a request
+        self._inflight: dict[Hashable, asyncio.Task] = {}
 
     def _update_auth(self) -> None:
         """Load CivitAI API key from settings and update client headers."""
@@ -42,21 +49,40 @@ class CivitaiClient:
         """Refresh auth headers (call after settings change)."""
         self._update_auth()
 
-    def _is_fresh(self, entry: tuple[float, dict], ttl: float) -> bool:
-        return (time.monotonic() - entry[0]) < ttl
-
-    def _evict_stale(self, cache: dict, ttl: float) -> None:
-        """Remove expired entries and enforce max size."""
-        now = time.monotonic()
-        stale_keys = [k for k, (ts, _) in cache.items() if (now - ts) >= ttl]
-        for k in stale_keys:
-            del cache[k]
-        # If still over limit, drop oldest entries
+    def _cache_get(self, cache: OrderedDict, key, ttl: float) -> Optional[dict]:
+        """Return a fresh cached response and mark it recently used."""
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        if (time.monotonic() - entry[0]) >= ttl:
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return entry[1]
+
+    def _cache_put(self, cache: OrderedDict, key, data: dict, ttl: float) -> None:
+        """Insert a response, evicting the least recently used entry when full."""
+        cache[key] = (time.monotonic(), data)
+        cache.move_to_end(key)
         if len(cache) > MAX_CACHE_ENTRIES:
-            sorted_keys = sorted(cache, key=lambda k: cache[k][0])
-            for k in sorted_keys[: len(cache) - MAX_CACHE_ENTRIES]:
+            cache.popitem(last=False)
+        # Expired entries are otherwise only dropped when looked up
+        self._cache_inserts += 1
+        if self._cache_inserts % STALE_SWEEP_INTERVAL == 0:
+            now = time.monotonic()
+            for k in [k for k, (ts, _) in cache.items() if (now - ts) >= ttl]:
                 del cache[k]
 
+    async def _fetch_once(self, key: Hashable, fetch: Callable[[], Awaitable[dict]]) -> dict:
+        """Run fetch() unless a call for the same key is already in flight, then share its result."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one caller disconnecting doesn't cancel the others' fetch
+        return await asyncio.shield(task)
+
     def _search_cache_key(
         self,
         query: Optional[str],
@@ -84,64 +110,66 @@ class CivitaiClient:
         cache_key = self._search_cache_key(query, types, sort, nsfw, base_models, limit, cursor, tag)
 
         # Check cache
-        cached = self._search_cache.get(cache_key)
-        if cached and self._is_fresh(cached, SEARCH_CACHE_TTL):
+        cached = self._cache_get(self._search_cache, cache_key, SEARCH_CACHE_TTL)
+        if cached is not None:
             logger.debug("CivitAI search cache hit: %s", cache_key)
-            return cached[1]
-
-        params = {"limit": limit}
-        if query:
-            params["query"] = query
-        if types:
-            params["types"] = types
-        if sort:
-            params["sort"] = sort
-        if nsfw is not None:
-            params["nsfw"] = str(nsfw).lower()
-        if base_models:
-            # Civitai API expects repeated baseModels params
-            pass
-        if cursor:
-            params["cursor"] = cursor
-        if tag:
-            params["tag"] = tag
-
-        # Handle baseModels as repeated query params
-        url = "/models"
-        if base_models:
-            parts = [f"baseModels={bm.strip()}" for bm in base_models.split(",")]
-            extra = "&".join(parts)
-            param_str = "&".join(f"{k}={v}" for k, v in params.items())
-            url = f"/models?{param_str}&{extra}"
-            resp = await self.client.get(url)
-        else:
-            resp = await self.client.get("/models", params=params)
-
-        resp.raise_for_status()
-        data = resp.json()
-
-        # Store in cache
-        self._search_cache[cache_key] = (time.monotonic(), data)
-        self._evict_stale(self._search_cache, SEARCH_CACHE_TTL)
-
-        return data
+            return cached
+
+        async def fetch() -> dict:
+            params = {"limit": limit}
+            if query:
+                params["query"] = query
+            if types:
+                params["types"] = types
+            if sort:
+                params["sort"] = sort
+            if nsfw is not None:
+                params["nsfw"] = str(nsfw).lower()
+            if base_models:
+                # Civitai API expects repeated baseModels params
+                pass
+            if cursor:
+                params["cursor"] = cursor
+            if tag:
+                params["tag"] = tag
+
+            # Handle baseModels as repeated query params
+            url = "/models"
+            if base_models:
+                parts = [f"baseModels={bm.strip()}" for bm in base_models.split(",")]
+                extra = "&".join(parts)
+                param_str = "&".join(f"{k}={v}" for k, v in params.items())
+                url = f"/models?{param_str}&{extra}"
+                resp = await self.client.get(url)
+            else:
+                resp = await self.client.get("/models", params=params)
+
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
+
+            # Store in cache
+            self._cache_put(self._search_cache, cache_key, data, SEARCH_CACHE_TTL)
+            return data
+
+        return await self._fetch_once(("search", cache_key), fetch)
 
     async def get_model(self, model_id: int) -> dict:
         # Check cache
-        cached = self._model_cache.get(model_id)
-        if cached and self._is_fresh(cached, MODEL_CACHE_TTL):
+        cached = self._cache_get(self._model_cache, model_id, MODEL_CACHE_TTL)
+        if cached is not None:
             logger.debug("CivitAI model cache hit: %d", model_id)
-            return cached[1]
+            return cached
 
-        resp = await self.client.get(f"/models/{model_id}")
-        resp.raise_for_status()
-        data = resp.json()
+        async def fetch() -> dict:
+            resp = await self.client.get(f"/models/{model_id}")
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
 
-        # Store in cache
-        self._model_cache[model_id] = (time.monotonic(), data)
-        self._evict_stale(self._model_cache, MODEL_CACHE_TTL)
+            # Store in cache
+            self._cache_put(self._model_cache, model_id, data, MODEL_CACHE_TTL)
+            return data
 
-        return data
+        return await self._fetch_once(("model", model_id), fetch)
 
     async def close(self):
         await self.client.aclose()
@@ -16,6 +16,7 @@ from ..models.civitai_schemas import (
 )
 from ..routers.settings import add_log, update_log, RequestLog
 from ..utils.paths import get_data_dir
+from ..utils.json_io import write_json
 
 
 class CivitaiDownloadManager:
@@ -80,8 +81,7 @@ class CivitaiDownloadManager:
                         job_dict[dt_field] = job_dict[dt_field].isoformat()
                 jobs_data.append(job_dict)
 
-        with open(jobs_file, "w") as f:
-            json.dump({"jobs": jobs_data}, f, indent=2)
+        write_json(jobs_file, {"jobs": jobs_data})
 
     def create_download(self, request: CivitaiDownloadRequest) -> CivitaiDownloadJob:
         job = CivitaiDownloadJob(
@@ -290,8 +290,7 @@ class CivitaiDownloadManager:
                 "filename": job.filename,
                 "downloaded_at": datetime.utcnow().isoformat(),
             }
-            with open(metadata_path, "w") as f:
-                json.dump(metadata, f, indent=2)
+            write_json(metadata_path, metadata)
 
             # Register in civitai-models.json for inference service
             if job.type.upper() == "CHECKPOINT":
@@ -352,8 +351,7 @@ class CivitaiDownloadManager:
             "category": "civitai",
         }
 
-        with open(registry_file, "w") as f:
-            json.dump(registry, f, indent=2)
+        write_json(registry_file, registry)
 
 
 # Singleton
@@ -9,7 +9,6 @@ Extends BaseJobManager to provide:
 
 import json
 import uuid
-import asyncio
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -18,6 +17,7 @@ from ..models.schemas import (
     ComfyUIJob, ComfyUIGenerateRequest, ImageResult, JobStatus
 )
 from ..utils.paths import get_output_dir, get_data_dir
+from ..utils.json_io import write_json
 from .base_job_manager import BaseJobManager
 from .comfyui_client import get_comfyui_client
 from .comfyui_workflow_parser import WorkflowParser
@@ -93,9 +93,9 @@ class ComfyUIJobManager(BaseJobManager[ComfyUIJob]):
         )
 
         with self.lock:
-            self.jobs[job.id] = job
+            self._add_job(job)
 
-        self.job_queue.put(job.id)
+        self._enqueue(job.id)
         self._save_jobs()
 
         return job
@@ -114,11 +114,8 @@ class ComfyUIJobManager(BaseJobManager[ComfyUIJob]):
         if not job:
             return
 
-        # Run async processing in event loop
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(self._process_job_async(job_id))
+            self._run_async(self._process_job_async(job_id))
         except Exception as e:
             print(f"ComfyUI job {job_id} failed: {e}")
             self._update_job(
@@ -127,8 +124,6 @@ class ComfyUIJobManager(BaseJobManager[ComfyUIJob]):
                 error=str(e),
                 completed_at=datetime.utcnow()
             )
-        finally:
-            loop.close()
 
     async def _process_job_async(self, job_id: str) -> None:
         """Async implementation of job processing."""
@@ -283,8 +278,7 @@ class ComfyUIJobManager(BaseJobManager[ComfyUIJob]):
                 }
 
                 metadata_path = output_dir / f"{asset_id}.json"
-                with open(metadata_path, "w") as f:
-                    json.dump(metadata, f, indent=2)
+                write_json(metadata_path, metadata)
 
                 results.append(ImageResult(
                     id=asset_id,
@@ -3,7 +3,9 @@
 import asyncio
 import json
 import logging
+from pathlib import Path
 
+import aiofiles
 import httpx
 
 from ..utils.paths import get_data_dir
@@ -144,17 +146,25 @@ async def generate_image(
         }
 
 
-async def download_image(url: str) -> bytes:
-    """Download an image from a URL.
+async def download_image_to_path(url: str, path: Path, chunk_size: int = 64 * 1024) -> None:
+    """Stream an image from a URL straight into a file.
+
+    Chunks are written through aiofiles as they arrive, so the whole image
+    is never held in memory. A partial file is removed on failure.
 
     Args:
         url: URL of the image to download.
-
-    Returns:
-        Image data as bytes.
+        path: Destination file path.
+        chunk_size: Bytes per read from the response stream.
     """
     async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-        response = await client.get(url)
-        if response.status_code != 200:
-            raise ValueError(f"Failed to download image: HTTP {response.status_code}")
-        return response.content
+        async with client.stream("GET", url) as response:
+            if response.status_code != 200:
+                raise ValueError(f"Failed to download image: HTTP {response.status_code}")
+            try:
+                async with aiofiles.open(path, "wb") as f:
+                    async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                        await f.write(chunk)
+            except BaseException:
+                path.unlink(missing_ok=True)
+                raise
@@ -3,9 +3,8 @@
 Handles asynchronous I2V generation with progress tracking and persistence.
 """
 
-import json
 import uuid
-import random
+import secrets
 import base64
 import io
 from datetime import datetime
@@ -15,6 +14,8 @@ from PIL import Image
 
 from ..models.schemas import I2VJob, VideoResult, JobStatus, I2VGenerateRequest
 from ..utils.paths import get_output_dir
+from ..utils.json_io import write_json
+from ..utils.images import save_png
 from .inference import get_inference_service
 from .base_job_manager import BaseJobManager
 
@@ -29,6 +30,9 @@ I2V_MODEL_BASE_TIMES = {
 # Time to load a new model (seconds)
 MODEL_LOAD_TIME = 60
 
+# Model config types that accept a source image
+I2V_MODEL_TYPES: frozenset[str] = frozenset({"video-i2v", "svd", "wan-i2v"})
+
 
 class I2VJobManager(BaseJobManager[I2VJob]):
     _jobs_filename = "i2v_jobs.json"
@@ -59,7 +63,7 @@ class I2VJobManager(BaseJobManager[I2VJob]):
         """Save a source image and return its URL."""
         output_dir = get_output_dir()
         image_path = output_dir / f"{job_id}_source_{index}.png"
-        image.save(image_path, "PNG")
+        save_png(image, image_path)
         return f"/outputs/{job_id}_source_{index}.png"
 
     def _load_source_images(self, request: I2VGenerateRequest, job_id: str) -> tuple[list, list[str]]:
@@ -133,7 +137,7 @@ class I2VJobManager(BaseJobManager[I2VJob]):
             raise ValueError(f"Unknown model: {request.model}")
 
         model_type = model_config.get("type")
-        if model_type not in ["video-i2v", "svd", "wan-i2v"]:
+        if model_type not in I2V_MODEL_TYPES:
             raise ValueError(f"Model {request.model} does not support I2V")
 
         steps = request.steps if request.steps else model_config["default_steps"]
@@ -172,9 +176,9 @@ class I2VJobManager(BaseJobManager[I2VJob]):
         self._pending_images[job_id] = images
 
         with self.lock:
-            self.jobs[job.id] = job
+            self._add_job(job)
 
-        self.job_queue.put(job.id)
+        self._enqueue(job.id)
         self._save_jobs()
 
         return job
@@ -258,7 +262,7 @@ class I2VJobManager(BaseJobManager[I2VJob]):
 
             # Get actual values
             guidance = model_config["default_guidance"]
-            seed = random.randint(0, 2**32 - 1)
+            seed = secrets.randbits(32)
 
             # Generate I2V
             output_path, actual_seed, actual_frames, actual_fps, audio_path = service.generate_video_from_image(
@@ -302,8 +306,7 @@ class I2VJobManager(BaseJobManager[I2VJob]):
                 "created_at": datetime.utcnow().isoformat(),
             }
 
-            with open(metadata_path, "w") as f:
-                json.dump(metadata, f, indent=2)
+            write_json(metadata_path, metadata)
 
             # Create video result
             video_result = VideoResult(
@@ -1,7 +1,9 @@
 import torch
 import yaml
-import random
+import secrets
 import time
+from bisect import bisect_right
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Callable
 from diffusers import (
@@ -49,6 +51,7 @@ from PIL import Image
 
 
 from ..utils.paths import get_data_dir
+from ..utils.cpu_affinity import inference_cores
 
 # Download progress callback type
 DownloadCallback = Callable[[float, float, float], None]  # (progress_pct, total_mb, speed_mbps)
@@ -56,15 +59,46 @@ DownloadCallback = Callable[[float, float, float], None]  # (progress_pct, total
 LoadProgressCallback = Callable[[float], None]  # (progress_pct)
 
 
+@dataclass(slots=True, frozen=True)
+class ModelSpec:
+    """The parts of a model's config that request checks read, resolved once."""
+    id: str
+    name: str
+    type: Optional[str]
+    memory_gb: float  # memory_gb (actual RAM) if set, else size_gb (disk size)
+
+    @classmethod
+    def from_config(cls, model_id: str, model_config: dict) -> "ModelSpec":
+        return cls(
+            id=model_id,
+            name=model_config.get("name", model_id),
+            type=model_config.get("type"),
+            memory_gb=model_config.get("memory_gb") or model_config.get("size_gb", 12),
+        )
+
+
 class InferenceService:
     def __init__(self, config_path: str = "config.yaml"):
         self.config = self._load_config(config_path)
-        self.civitai_models: dict = self._load_civitai_models()
+        self.model_specs: dict[str, ModelSpec] = {
+            model_id: ModelSpec.from_config(model_id, model_config)
+            for model_id, model_config in self.config["models"].items()
+        }
+        self._index_video_models()
+        self.civitai_models: dict = {}
+        self._civitai_registry_stamp: Optional[tuple[int, int]] = None
+        self.reload_civitai_models()
         self.current_model_id: Optional[str] = None
         self.pipeline = None
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         self.dtype = torch.bfloat16 if self.device == "cuda" else torch.float32
 
+        # With HOLLYWOOL_UVICORN_CORES set, size torch's CPU pool to the cores
+        # left for inference so it doesn't oversubscribe the pinned set
+        cores = inference_cores()
+        if cores:
+            torch.set_num_threads(len(cores))
+
         # Warn if GPU hardware is present but torch lacks CUDA support
         if self.device == "cpu":
             try:
@@ -85,6 +119,21 @@ class InferenceService:
         with open(config_file, "r") as f:
             return yaml.safe_load(f)
 
+    def _index_video_models(self) -> None:
+        """Precompute the free memory each configured video model needs, ascending."""
+        needed = []
+        for spec in self.model_specs.values():
+            if spec.type in ("video", "ltx2"):
+                # Required: model + 5GB overhead + 10GB buffer
+                needed.append((spec.memory_gb + 5.0 + 10.0, spec.id))
+        needed.sort()
+        self._video_model_thresholds = [threshold for threshold, _ in needed]
+        self._video_model_ids = [model_id for _, model_id in needed]
+
+    def recommended_video_models(self, memory_available_gb: float) -> list[str]:
+        """Video models that fit in the given free memory, smallest first."""
+        return self._video_model_ids[:bisect_right(self._video_model_thresholds, memory_available_gb)]
+
     def _load_civitai_models(self) -> dict:
         registry_file = get_data_dir() / "civitai-models.json"
         if registry_file.exists():
@@ -97,6 +146,16 @@ class InferenceService:
         return {}
 
     def reload_civitai_models(self) -> None:
+        """Re-read the Civitai registry only if it changed on disk since the last load."""
+        registry_file = get_data_dir() / "civitai-models.json"
+        try:
+            st = registry_file.stat()
+            stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = None
+        if stamp == self._civitai_registry_stamp:
+            return
+        self._civitai_registry_stamp = stamp
         self.civitai_models = self._load_civitai_models()
 
     def get_available_models(self) -> list[dict]:
@@ -144,6 +203,14 @@ class InferenceService:
         self.reload_civitai_models()
         return self.civitai_models.get(model_id)
 
+    def get_model_spec(self, model_id: str) -> Optional[ModelSpec]:
+        spec = self.model_specs.get(model_id)
+        if spec:
+            return spec
+        # Civitai registry entries can change at runtime; resolve per call
+        model_config = self.get_model_config(model_id)
+        return ModelSpec.from_config(model_id, model_config) if model_config else None
+
     def is_model_cached(self, model_id: str) -> bool:
         """Check if a model is already downloaded/cached.
 
@@ -479,6 +546,40 @@ class InferenceService:
         seed: Optional[int] = None,
         loras: Optional[list] = None,
     ) -> tuple[Image.Image, int]:
+        if seed is None:
+            seed = secrets.randbits(32)
+
+        return self.generate_batch(
+            prompt=prompt,
+            model_id=model_id,
+            seeds=[seed],
+            negative_prompt=negative_prompt,
+            width=width,
+            height=height,
+            steps=steps,
+            guidance_scale=guidance_scale,
+            loras=loras,
+        )[0]
+
+    def generate_batch(
+        self,
+        prompt: str | list[str],
+        model_id: str,
+        seeds: list[int],
+        negative_prompt: Optional[str] = None,
+        width: int = 1024,
+        height: int = 1024,
+        steps: Optional[int] = None,
+        guidance_scale: Optional[float] = None,
+        loras: Optional[list] = None,
+    ) -> list[tuple[Image.Image, int]]:
+        """Generate one image per seed in a single batched pipeline call.
+
+        Each image gets its own seeded generator, so results match what
+        separate generate() calls with the same seeds would produce.
+        prompt may also be a list with one prompt per seed, for coalescing
+        different requests into one batch.
+        """
         self.load_model(model_id)
 
         model_config = self.get_model_config(model_id)
@@ -488,8 +589,6 @@ class InferenceService:
             steps = model_config["default_steps"]
         if guidance_scale is None:
             guidance_scale = model_config["default_guidance"]
-        if seed is None:
-            seed = random.randint(0, 2**32 - 1)
 
         # Apply LoRAs if provided and model supports them
         if loras and model_type in ["flux", "sdxl", "sd", "sd3"]:
@@ -505,7 +604,7 @@ class InferenceService:
         if loras:
             self._loras_applied = True
 
-        generator = torch.Generator(device=self.device).manual_seed(seed)
+        generators = [torch.Generator(device=self.device).manual_seed(s) for s in seeds]
 
         # Build generation kwargs based on model type
         gen_kwargs = {
@@ -513,7 +612,8 @@ class InferenceService:
             "width": width,
             "height": height,
             "num_inference_steps": steps,
-            "generator": generator,
+            "num_images_per_prompt": 1 if isinstance(prompt, list) else len(seeds),
+            "generator": generators,
         }
 
         if model_type != "flux":
@@ -525,8 +625,8 @@ class InferenceService:
             if guidance_scale > 0:
                 gen_kwargs["guidance_scale"] = guidance_scale
 
-        image = self.pipeline(**gen_kwargs).images[0]
-        return image, seed
+        images = self.pipeline(**gen_kwargs).images
+        return list(zip(images, seeds))
 
     def generate_from_image(
         self,
@@ -557,7 +657,7 @@ class InferenceService:
         if guidance_scale is None:
             guidance_scale = model_config["default_guidance"]
         if seed is None:
-            seed = random.randint(0, 2**32 - 1)
+            seed = secrets.randbits(32)
 
         # Create I2I pipeline from existing T2I pipeline (shares weights)
         i2i_pipeline = AutoPipelineForImage2Image.from_pipe(self.pipeline)
@@ -626,7 +726,7 @@ class InferenceService:
         if fps is None:
             fps = model_config.get("default_fps", 8)
         if seed is None:
-            seed = random.randint(0, 2**32 - 1)
+            seed = secrets.randbits(32)
 
         generator = torch.Generator(device=self.device).manual_seed(seed)
         audio_path = None
@@ -809,7 +909,7 @@ class InferenceService:
         if fps is None:
             fps = model_config.get("default_fps", 8)
         if seed is None:
-            seed = random.randint(0, 2**32 - 1)
+            seed = secrets.randbits(32)
 
         generator = torch.Generator(device=self.device).manual_seed(seed)
 
@@ -1,15 +1,19 @@
-import json
+import os
 import uuid
-import random
+import secrets
 import base64
 import io
+import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
+from queue import Empty
 from typing import Optional
 from PIL import Image
 
 from ..models.schemas import Job, JobStatus, ImageResult, GenerateRequest
 from ..utils.paths import get_output_dir
+from ..utils.images import save_png, save_image_asset, image_io_executor
 from .inference import get_inference_service
 from .base_job_manager import BaseJobManager
 
@@ -33,12 +37,23 @@ MODEL_BASE_TIMES = {
 # Time to load a new model (seconds)
 MODEL_LOAD_TIME = 30
 
+# Micro-batching: queued text-to-image jobs with the same model, size and
+# steps are coalesced into one pipeline call of at most MAX_BATCH images,
+# waiting up to MAX_LATENCY_S for companions to arrive
+MAX_BATCH = int(os.environ.get("HOLLYWOOL_MAX_BATCH", "4"))
+MAX_LATENCY_S = int(os.environ.get("HOLLYWOOL_MAX_LATENCY_MS", "50")) / 1000
 
 class JobManager(BaseJobManager[Job]):
     _jobs_filename = "jobs.json"
     _job_type = Job
     _worker_name = "Worker"
 
+    def __init__(self):
+        # Job IDs taken off the queue during a batch window but not batchable
+        # with it; must exist before the base class schedules the first drain
+        self._deferred: deque[str] = deque()
+        super().__init__()
+
     def _estimate_time(self, model: str, steps: int, num_images: int, include_model_load: bool = False) -> float:
         """Estimate generation time in seconds."""
         base_time = MODEL_BASE_TIMES.get(model, 30)
@@ -60,7 +75,7 @@ class JobManager(BaseJobManager[Job]):
         """Save a source image and return its URL."""
         output_dir = get_output_dir()
         image_path = output_dir / f"{job_id}_source_{index}.png"
-        image.save(image_path, "PNG")
+        save_png(image, image_path)
         return f"/outputs/{job_id}_source_{index}.png"
 
     def _load_reference_images(self, request: GenerateRequest, job_id: str) -> tuple[list, list[str]]:
@@ -134,13 +149,266 @@ class JobManager(BaseJobManager[Job]):
         )
 
         with self.lock:
-            self.jobs[job.id] = job
+            self._add_job(job)
 
-        self.job_queue.put(job.id)
+        self._enqueue(job.id)
         self._save_jobs()
 
         return job
 
+    def _batch_key(self, job: Job) -> Optional[tuple]:
+        """Jobs with equal keys can share one pipeline call; I2I jobs never batch."""
+        if job.source_image_urls:
+            return None
+        return (job.model, job.width, job.height, job.steps)
+
+    def _next_job_id(self) -> Optional[str]:
+        """Take a job left over from the previous batch window, else the next queued one."""
+        if self._deferred:
+            return self._deferred.popleft()
+        try:
+            return self.job_queue.get_nowait()
+        except Empty:
+            return None
+
+    def _has_pending(self) -> bool:
+        return bool(self._deferred) or super()._has_pending()
+
+    def _collect_batch(self, first_id: str) -> list[str]:
+        """Coalesce compatible queued jobs with first_id, up to MAX_BATCH images.
+
+        Waits at most MAX_LATENCY_S for companions. Incompatible jobs pulled
+        off the queue meanwhile are deferred, in order, to the next round.
+        """
+        first = self.get_job(first_id)
+        key = self._batch_key(first) if first else None
+        if key is None or first.num_images >= MAX_BATCH:
+            return [first_id]
+
+        batch = [first_id]
+        total_images = first.num_images
+
+        def try_add(job_id: str) -> bool:
+            nonlocal total_images
+            job = self.get_job(job_id)
+            if job and self._batch_key(job) == key and total_images + job.num_images <= MAX_BATCH:
+                batch.append(job_id)
+                total_images += job.num_images
+                return True
+            return False
+
+        for job_id in list(self._deferred):
+            if try_add(job_id):
+                self._deferred.remove(job_id)
+
+        deadline = time.monotonic() + MAX_LATENCY_S
+        while total_images < MAX_BATCH:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                job_id = self.job_queue.get(timeout=remaining)
+            except Empty:
+                break
+            if not try_add(job_id):
+                self._deferred.append(job_id)
+
+        return batch
+
+    def _worker(self) -> None:
+        """Run queued jobs, compatible ones as one batch, until none are left."""
+        while True:
+            first_id = self._next_job_id()
+            if first_id is None:
+                return
+            batch = []
+            try:
+                batch = self._collect_batch(first_id)
+                self.current_job_id = batch[0]
+                if len(batch) == 1:
+                    self._process_job(batch[0])
+                else:
+                    self._process_batch(batch)
+            except Exception as e:
+                print(f"{self._worker_name} error: {e}")
+                # Leave jobs the batch already completed alone
+                unfinished = [jid for jid in batch
+                              if (job := self.get_job(jid)) and job.status != JobStatus.COMPLETED]
+                if unfinished:
+                    self._update_jobs(unfinished, status=JobStatus.FAILED, error=str(e))
+            self.current_job_id = None
+
+    def _prepare_model(self, job_ids: list[str], model: str) -> None:
+        """Download and/or load a model, reporting progress on every job in job_ids."""
+        service = get_inference_service()
+
+        # Check if model needs downloading
+        needs_download = not service.is_model_cached(model)
+
+        # Load progress callback
+        def load_progress_callback(progress_pct: float):
+            self._update_jobs(job_ids, load_progress=progress_pct)
+
+        if needs_download:
+            # Update to downloading status
+            self._update_jobs(job_ids,
+                              status=JobStatus.DOWNLOADING,
+                              started_at=datetime.utcnow(),
+                              download_progress=0)
+
+            # Download callback to update job progress
+            def download_progress_callback(progress_pct: float, total_mb: float, speed_mbps: float):
+                self._update_jobs(job_ids,
+                                  download_progress=progress_pct,
+                                  download_total_mb=total_mb,
+                                  download_speed_mbps=speed_mbps)
+
+            # Load model with download tracking
+            self._update_jobs(job_ids, status=JobStatus.LOADING_MODEL, load_progress=0)
+            service.load_model(model, download_callback=download_progress_callback, load_progress_callback=load_progress_callback)
+        else:
+            # Update to loading model status
+            self._update_jobs(job_ids,
+                              status=JobStatus.LOADING_MODEL,
+                              started_at=datetime.utcnow(),
+                              load_progress=0)
+
+            # Load model if needed (no download) with progress tracking
+            service.load_model(model, load_progress_callback=load_progress_callback)
+
+    def _submit_save(self, job: Job, image: Image.Image, actual_seed: int, guidance: float, is_i2i: bool):
+        """Queue the PNG + metadata write for one image; returns (future, ImageResult)."""
+        output_dir = get_output_dir()
+        asset_id = str(uuid.uuid4())
+        image_path = output_dir / f"{asset_id}.png"
+        metadata_path = output_dir / f"{asset_id}.json"
+
+        metadata = {
+            "id": asset_id,
+            "filename": f"{asset_id}.png",
+            "prompt": job.prompt,
+            "negative_prompt": None,
+            "model": job.model,
+            "width": job.width,
+            "height": job.height,
+            "steps": job.steps,
+            "guidance_scale": guidance,
+            "seed": actual_seed,
+            "batch_id": job.batch_id,
+            "created_at": datetime.utcnow().isoformat(),
+        }
+
+        # Add I2I metadata if applicable
+        if is_i2i:
+            metadata["source_image_urls"] = job.source_image_urls
+            metadata["strength"] = job.strength
+
+        # Save in the background while the next image is generated
+        future = image_io_executor.submit(
+            save_image_asset, image, image_path, metadata, metadata_path,
+        )
+        result = ImageResult(
+            id=asset_id,
+            filename=f"{asset_id}.png",
+            url=f"/outputs/{asset_id}.png",
+            seed=actual_seed,
+        )
+        return future, result
+
+    def _complete_job(self, job: Job, save_futures: list, images_results: list[ImageResult]) -> None:
+        """Wait for a job's outstanding saves (re-raises any write error) and mark it completed."""
+        self._update_job(job.id, status=JobStatus.SAVING)
+        for future in save_futures:
+            future.result()
+
+        # Update job as completed
+        with self.lock:
+            if job.id in self.jobs:
+                self.jobs[job.id].images = images_results
+
+        self._update_job(job.id,
+                         status=JobStatus.COMPLETED,
+                         progress=100.0,
+                         current_image=job.num_images,
+                         eta_seconds=0,
+                         completed_at=datetime.utcnow())
+
+    def _process_batch(self, job_ids: list[str]) -> None:
+        """Process several compatible text-to-image jobs in one pipeline call."""
+        jobs = [job for job in (self.get_job(jid) for jid in job_ids) if job]
+        if not jobs:
+            return
+        job_ids = [job.id for job in jobs]
+        lead = jobs[0]
+
+        service = get_inference_service()
+        model_config = service.get_model_config(lead.model)
+
+        if not model_config:
+            self._update_jobs(job_ids, status=JobStatus.FAILED, error=f"Unknown model: {lead.model}")
+            return
+
+        try:
+            self._prepare_model(job_ids, lead.model)
+
+            guidance = model_config["default_guidance"]
+            total_images = sum(job.num_images for job in jobs)
+
+            # One prompt + seed per image; each job keeps its own base seed
+            prompts = []
+            seeds = []
+            for job in jobs:
+                base_seed = secrets.randbits(32)
+                prompts.extend([job.prompt] * job.num_images)
+                seeds.extend((base_seed + i) % 2**32 for i in range(job.num_images))
+
+            self._update_jobs(job_ids,
+                              status=JobStatus.GENERATING,
+                              progress=0.0,
+                              eta_seconds=self._estimate_time(lead.model, lead.steps, total_images))
+
+            generated = service.generate_batch(
+                prompt=prompts,
+                model_id=lead.model,
+                seeds=seeds,
+                width=lead.width,
+                height=lead.height,
+                steps=lead.steps,
+                guidance_scale=guidance,
+            )
+
+        except Exception as e:
+            print(f"Batch {job_ids} failed: {e}")
+            self._update_jobs(job_ids,
+                              status=JobStatus.FAILED,
+                              error=str(e),
+                              completed_at=datetime.utcnow())
+            return
+
+        # Split the batch back into per-job results; one job failing to save
+        # must not touch the others
+        offset = 0
+        for job in jobs:
+            images = generated[offset:offset + job.num_images]
+            offset += job.num_images
+            try:
+                save_futures = []
+                images_results = []
+                for image, actual_seed in images:
+                    future, result = self._submit_save(job, image, actual_seed, guidance, is_i2i=False)
+                    save_futures.append(future)
+                    images_results.append(result)
+                self._complete_job(job, save_futures, images_results)
+            except Exception as e:
+                print(f"Job {job.id} in batch failed: {e}")
+                current = self.get_job(job.id)
+                if current and current.status == JobStatus.COMPLETED:
+                    continue  # only the final save raised; the images are on disk
+                self._update_job(job.id,
+                                 status=JobStatus.FAILED,
+                                 error=str(e),
+                                 completed_at=datetime.utcnow())
+
     def _process_job(self, job_id: str) -> None:
         """Process a single job."""
         job = self.get_job(job_id)
@@ -155,49 +423,18 @@ class JobManager(BaseJobManager[Job]):
             return
 
         try:
-            # Check if model needs downloading
-            needs_download = not service.is_model_cached(job.model)
-
-            # Load progress callback
-            def load_progress_callback(progress_pct: float):
-                self._update_job(job_id, load_progress=progress_pct)
-
-            if needs_download:
-                # Update to downloading status
-                self._update_job(job_id,
-                               status=JobStatus.DOWNLOADING,
-                               started_at=datetime.utcnow(),
-                               download_progress=0)
-
-                # Download callback to update job progress
-                def download_progress_callback(progress_pct: float, total_mb: float, speed_mbps: float):
-                    self._update_job(job_id,
-                                   download_progress=progress_pct,
-                                   download_total_mb=total_mb,
-                                   download_speed_mbps=speed_mbps)
-
-                # Load model with download tracking
-                self._update_job(job_id, status=JobStatus.LOADING_MODEL, load_progress=0)
-                service.load_model(job.model, download_callback=download_progress_callback, load_progress_callback=load_progress_callback)
-            else:
-                # Update to loading model status
-                self._update_job(job_id,
-                               status=JobStatus.LOADING_MODEL,
-                               started_at=datetime.utcnow(),
-                               load_progress=0)
-
-                # Load model if needed (no download) with progress tracking
-                service.load_model(job.model, load_progress_callback=load_progress_callback)
+            self._prepare_model([job_id], job.model)
 
             # Get actual values
             guidance = model_config["default_guidance"]
 
             # Generate base seed
-            base_seed = random.randint(0, 2**32 - 1)
+            base_seed = secrets.randbits(32)
 
             output_dir = get_output_dir()
 
             images_results = []
+            save_futures = []
 
             # Check for I2I mode: retrieve pending reference images
             self._pending_images = getattr(self, '_pending_images', {})
@@ -227,7 +464,7 @@ class JobManager(BaseJobManager[Job]):
                                current_image=i + 1,
                                eta_seconds=eta)
 
-                image_seed = base_seed + i
+                image_seed = (base_seed + i) % 2**32
 
                 if is_i2i and ref_images:
                     # Image-to-Image generation
@@ -254,56 +491,11 @@ class JobManager(BaseJobManager[Job]):
                         seed=image_seed,
                     )
 
-                # Save image
-                self._update_job(job_id, status=JobStatus.SAVING)
-
-                asset_id = str(uuid.uuid4())
-                image_path = output_dir / f"{asset_id}.png"
-                metadata_path = output_dir / f"{asset_id}.json"
-
-                image.save(image_path, "PNG")
-
-                metadata = {
-                    "id": asset_id,
-                    "filename": f"{asset_id}.png",
-                    "prompt": job.prompt,
-                    "negative_prompt": None,
-                    "model": job.model,
-                    "width": job.width,
-                    "height": job.height,
-                    "steps": job.steps,
-                    "guidance_scale": guidance,
-                    "seed": actual_seed,
-                    "batch_id": job.batch_id,
-                    "created_at": datetime.utcnow().isoformat(),
-                }
-
-                # Add I2I metadata if applicable
-                if is_i2i:
-                    metadata["source_image_urls"] = job.source_image_urls
-                    metadata["strength"] = job.strength
-
-                with open(metadata_path, "w") as f:
-                    json.dump(metadata, f, indent=2)
-
-                images_results.append(ImageResult(
-                    id=asset_id,
-                    filename=f"{asset_id}.png",
-                    url=f"/outputs/{asset_id}.png",
-                    seed=actual_seed,
-                ))
-
-            # Update job as completed
-            with self.lock:
-                if job_id in self.jobs:
-                    self.jobs[job_id].images = images_results
+                future, result = self._submit_save(job, image, actual_seed, guidance, is_i2i)
+                save_futures.append(future)
+                images_results.append(result)
 
-            self._update_job(job_id,
-                           status=JobStatus.COMPLETED,
-                           progress=100.0,
-                           current_image=job.num_images,
-                           eta_seconds=0,
-                           completed_at=datetime.utcnow())
+            self._complete_job(job, save_futures, images_results)
 
         except Exception as e:
             print(f"Job {job_id} failed: {e}")
@@ -3,9 +3,11 @@ System resource monitoring for video generation.
 Checks memory availability and GPU utilization before accepting jobs.
 """
 import platform
+import threading
+import time
 import psutil
 from typing import Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 
 def get_cpu_name() -> Optional[str]:
@@ -98,8 +100,25 @@ def get_gpu_utilization() -> Optional[float]:
         return None
 
 
+# Back-to-back job submissions and status polls share one probe: sampling
+# CPU load alone blocks for 100 ms, and the numbers barely move within a second
+RESOURCE_SNAPSHOT_TTL_S = 1.0
+_snapshot: Optional[tuple[float, ResourceStatus]] = None
+_snapshot_lock = threading.Lock()
+
+
 def get_system_resources() -> ResourceStatus:
-    """Get current system resource status."""
+    """Get current system resource status (a fresh copy; probed at most once per TTL)."""
+    global _snapshot
+    with _snapshot_lock:
+        if _snapshot is None or time.monotonic() - _snapshot[0] >= RESOURCE_SNAPSHOT_TTL_S:
+            _snapshot = (time.monotonic(), _probe_system_resources())
+        # Callers set is_available/rejection_reason on their copy
+        return replace(_snapshot[1])
+
+
+def _probe_system_resources() -> ResourceStatus:
+    """Sample memory, CPU and GPU usage."""
     memory = psutil.virtual_memory()
     cpu_percent = psutil.cpu_percent(interval=0.1)
     gpu_util = get_gpu_utilization()
@@ -12,6 +12,7 @@ from typing import Optional
 
 from ..models.schemas import UpscaleJob, VideoResult, JobStatus, VideoUpscaleRequest
 from ..utils.paths import get_output_dir
+from ..utils.json_io import write_json
 from .upscaler import get_upscaler_service
 from .base_job_manager import BaseJobManager
 
@@ -51,16 +52,19 @@ class UpscaleJobManager(BaseJobManager[UpscaleJob]):
         outputs_dir = get_output_dir()
         metadata_path = outputs_dir / f"{video_asset_id}.json"
 
-        if not metadata_path.exists():
+        # Open directly instead of exists()+open(): one syscall, no check/use race
+        try:
+            with open(metadata_path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
             return None
 
-        with open(metadata_path, "r") as f:
-            return json.load(f)
-
     def create_job(self, request: VideoUpscaleRequest) -> UpscaleJob:
         """Create a new upscale job and add it to the queue."""
         # Load source video metadata
         metadata = self._get_video_metadata(request.video_asset_id)
+        if metadata is None:
+            raise FileNotFoundError(f"Video metadata not found: {request.video_asset_id}")
         if not metadata:
             raise ValueError(f"Video asset not found: {request.video_asset_id}")
 
@@ -101,17 +105,16 @@ class UpscaleJobManager(BaseJobManager[UpscaleJob]):
         )
 
         with self.lock:
-            self.jobs[job.id] = job
+            self._add_job(job)
 
-        self.job_queue.put(job.id)
+        self._enqueue(job.id)
         self._save_jobs()
 
         return job
 
     def get_all_jobs(self) -> list[UpscaleJob]:
         """Get all upscale jobs."""
-        with self.lock:
-            return list(self.jobs.values())
+        return list(self._view.jobs.values())
 
     def _process_job(self, job_id: str) -> None:
         """Process a single upscale job."""
@@ -201,8 +204,7 @@ class UpscaleJobManager(BaseJobManager[UpscaleJob]):
                 "created_at": datetime.utcnow().isoformat(),
             }
 
-            with open(metadata_path, "w") as f:
-                json.dump(metadata, f, indent=2)
+            write_json(metadata_path, metadata)
 
             # Create video result
             video_result = VideoResult(
@@ -1,12 +1,12 @@
-import json
 import uuid
-import random
+import secrets
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from ..models.schemas import VideoJob, VideoResult, JobStatus, VideoGenerateRequest
 from ..utils.paths import get_output_dir
+from ..utils.json_io import write_json
 from .inference import get_inference_service
 from .base_job_manager import BaseJobManager
 
@@ -84,9 +84,9 @@ class VideoJobManager(BaseJobManager[VideoJob]):
         )
 
         with self.lock:
-            self.jobs[job.id] = job
+            self._add_job(job)
 
-        self.job_queue.put(job.id)
+        self._enqueue(job.id)
         self._save_jobs()
 
         return job
@@ -153,7 +153,7 @@ class VideoJobManager(BaseJobManager[VideoJob]):
 
             # Get actual values
             guidance = model_config["default_guidance"]
-            seed = random.randint(0, 2**32 - 1)
+            seed = secrets.randbits(32)
 
             # Generate video (returns audio_path for LTX-2 models)
             output_path, actual_seed, actual_frames, actual_fps, audio_path = service.generate_video(
@@ -197,8 +197,7 @@ class VideoJobManager(BaseJobManager[VideoJob]):
                 "created_at": datetime.utcnow().isoformat(),
             }
 
-            with open(metadata_path, "w") as f:
-                json.dump(metadata, f, indent=2)
+            write_json(metadata_path, metadata)
 
             # Create video result
             video_result = VideoResult(
@@ -2,5 +2,17 @@
 
 from .paths import get_output_dir, get_data_dir
 from .gpu_monitor import GPULoadMonitor, load_with_progress
+from .http_cache import cached_json_response, ttl_cached_json_response, invalidate_cached_responses
+from .images import save_png, encode_png, save_image_asset, image_io_executor
+from .json_io import json_bytes, write_json
+from .files import write_bytes, write_files
+from .clock import now_iso
+from .cpu_affinity import api_cores, inference_cores, pin_current_thread, pinned_to
 
-__all__ = ["get_output_dir", "get_data_dir", "GPULoadMonitor", "load_with_progress"]
+__all__ = [
+    "get_output_dir", "get_data_dir", "GPULoadMonitor", "load_with_progress",
+    "cached_json_response", "ttl_cached_json_response", "invalidate_cached_responses",
+    "save_png", "encode_png", "save_image_asset", "image_io_executor",
+    "json_bytes", "write_json", "write_bytes", "write_files", "now_iso",
+    "api_cores", "inference_cores", "pin_current_thread", "pinned_to",
+]
@@ -0,0 +1,25 @@
+"""Cheap wall-clock timestamps for request logging."""
+
+import time
+from datetime import datetime
+
+# Log timestamps only need ~100 ms granularity
+_RESOLUTION_S = 0.1
+
+_cached_iso = ""
+_cached_at = float("-inf")
+
+
+def now_iso() -> str:
+    """Local-time ISO timestamp, reformatted at most once per 100 ms.
+
+    A monotonic-clock check is much cheaper than datetime.now().isoformat(),
+    so bursts of requests share one formatted string. Races between threads
+    are benign: the worst case is an extra reformat.
+    """
+    global _cached_iso, _cached_at
+    now = time.monotonic()
+    if now - _cached_at >= _RESOLUTION_S:
+        _cached_iso = datetime.now().isoformat()
+        _cached_at = now
+    return _cached_iso
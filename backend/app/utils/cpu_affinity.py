@@ -0,0 +1,82 @@
+"""Optional CPU pinning that keeps the API event loop and inference apart.
+
+Set ``HOLLYWOOL_UVICORN_CORES`` (e.g. ``"0,1"`` or ``"0-3"``) to reserve
+those cores for the event loop and request-side work such as PNG encoding;
+job workers and torch's CPU threads are pinned to the remaining cores.
+Unset (the default) leaves scheduling to the OS. Linux only.
+"""
+
+import os
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator, Optional
+
+_API_CORES_ENV = "HOLLYWOOL_UVICORN_CORES"
+_HAS_AFFINITY = hasattr(os, "sched_setaffinity")
+
+
+def _parse_cores(spec: str) -> set[int]:
+    """Parse a core list like ``"0,1,4-6"``."""
+    cores: set[int] = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-", 1)
+            cores.update(range(int(start), int(end) + 1))
+        else:
+            cores.add(int(part))
+    return cores
+
+
+@lru_cache(maxsize=1)
+def _core_split() -> Optional[tuple[frozenset[int], frozenset[int]]]:
+    """Return (api_cores, inference_cores), or None when pinning is disabled."""
+    spec = os.environ.get(_API_CORES_ENV)
+    if not spec or not _HAS_AFFINITY:
+        return None
+    try:
+        requested = _parse_cores(spec)
+    except ValueError:
+        print(f"Ignoring invalid {_API_CORES_ENV}={spec!r}")
+        return None
+    available = os.sched_getaffinity(0)
+    api = requested & available
+    inference = available - api
+    if not api or not inference:
+        print(f"Ignoring {_API_CORES_ENV}={spec!r}: needs a non-empty split of cores {sorted(available)}")
+        return None
+    return frozenset(api), frozenset(inference)
+
+
+def api_cores() -> Optional[frozenset[int]]:
+    """Cores reserved for the event loop, or None when pinning is disabled."""
+    split = _core_split()
+    return split[0] if split else None
+
+
+def inference_cores() -> Optional[frozenset[int]]:
+    """Cores left for job workers and torch, or None when pinning is disabled."""
+    split = _core_split()
+    return split[1] if split else None
+
+
+def pin_current_thread(cores: Optional[frozenset[int]]) -> None:
+    """Restrict the calling thread (and threads it spawns later) to the given cores."""
+    if cores:
+        os.sched_setaffinity(0, cores)
+
+
+@contextmanager
+def pinned_to(cores: Optional[frozenset[int]]) -> Iterator[None]:
+    """Temporarily pin the calling thread, e.g. a shared executor thread running inference."""
+    if not cores:
+        yield
+        return
+    previous = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, cores)
+    try:
+        yield
+    finally:
+        os.sched_setaffinity(0, previous)
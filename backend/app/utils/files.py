@@ -0,0 +1,61 @@
+"""Batched file-writing helpers."""
+
+import os
+from pathlib import Path
+from typing import Iterable
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Large outputs (PNGs) are written once and only read back on demand by the
+# static file route; flush them and drop them from the page cache so model
+# weights stay resident. DONTNEED only evicts clean pages, hence the sync
+# first. Small sidecars are left alone.
+_FADVISE_MIN_BYTES = 256 * 1024
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+
+def write_bytes(path: Path | str, data: bytes) -> None:
+    """Write bytes to a file through a raw fd, bypassing Python's buffered io stack.
+
+    Small payloads (metadata sidecars) go out in a single write() syscall.
+    Large ones are synced to disk before being dropped from the page cache,
+    so this blocks on I/O; call it from a worker thread.
+    """
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        size = len(view)
+        while view:
+            view = view[os.write(fd, view):]
+        if _HAS_FADVISE and size >= _FADVISE_MIN_BYTES:
+            os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+def replace_bytes(path: Path | str, data: bytes) -> None:
+    """Atomically replace a file's contents: write a temp file, fsync, rename.
+
+    Readers see either the old or the new contents, never a torn write.
+    """
+    tmp_path = f"{path}.tmp"
+    fd = os.open(tmp_path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+def write_files(files: Iterable[tuple[Path, bytes]]) -> None:
+    """Write pre-serialized files back to back from the calling thread.
+
+    Each file's full contents go out in a single write, so a batch of
+    assets costs one worker-thread hop instead of one per file.
+    """
+    for path, data in files:
+        write_bytes(path, data)
@@ -0,0 +1,94 @@
+"""HTTP caching helpers (ETag / Cache-Control) for frequently polled endpoints."""
+
+import asyncio
+import hashlib
+import time
+from typing import Any, Callable, NamedTuple
+
+import orjson
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+
+def make_etag(body: bytes) -> str:
+    """Build a weak ETag from a serialized response body."""
+    return f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _etag_response(request: Request, body: bytes, etag: str, max_age: int) -> Response:
+    """Return body with ETag + Cache-Control, or a 304 if the client already has it."""
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"private, max-age={max_age}",
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def cached_json_response(request: Request, content: Any, max_age: int = 0) -> Response:
+    """Serialize content once and return it with ETag + Cache-Control headers.
+
+    Returns an empty 304 Not Modified when the client's If-None-Match
+    header already matches the current content.
+    """
+    body = orjson.dumps(jsonable_encoder(content))
+    return _etag_response(request, body, make_etag(body), max_age)
+
+
+# ============== Server-side TTL cache ==============
+
+class _CachedBody(NamedTuple):
+    expires: float
+    body: bytes
+    etag: str
+
+
+_ttl_cache: dict[str, _CachedBody] = {}
+_ttl_locks: dict[str, asyncio.Lock] = {}
+
+
+async def ttl_cached_json_response(
+    request: Request,
+    key: str,
+    producer: Callable[[], Any],
+    ttl: float = 5.0,
+    max_age: int = 0,
+) -> Response:
+    """Like cached_json_response, but reuse the serialized body for ttl seconds.
+
+    producer is blocking (e.g. walks the model cache on disk); on a miss it
+    runs in a worker thread, and concurrent misses for the same key share
+    one call.
+    """
+    entry = _ttl_cache.get(key)
+    if entry is None or entry.expires <= time.monotonic():
+        lock = _ttl_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = _ttl_cache.get(key)
+            if entry is None or entry.expires <= time.monotonic():
+                content = await asyncio.to_thread(producer)
+                body = orjson.dumps(jsonable_encoder(content))
+                entry = _CachedBody(time.monotonic() + ttl, body, make_etag(body))
+                _ttl_cache[key] = entry
+    return _etag_response(request, entry.body, entry.etag, max_age)
+
+
+def invalidate_cached_responses(*keys: str) -> None:
+    """Drop TTL-cached bodies for keys (and "key:..." variants) so they are recomputed."""
+    for cached_key in list(_ttl_cache):
+        if any(cached_key == key or cached_key.startswith(f"{key}:") for key in keys):
+            _ttl_cache.pop(cached_key, None)
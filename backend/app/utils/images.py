@@ -0,0 +1,72 @@
+"""Image encoding helpers shared by generation endpoints and job managers."""
+
+import io
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from PIL import Image
+
+from .files import write_bytes
+from .json_io import write_json
+
+# zlib level 1 encodes roughly 2x faster than Pillow's default (6) for a
+# modest size increase; optimize=False skips the extra encoder pass.
+PNG_COMPRESS_LEVEL = 1
+
+# Shared pool for PNG encoding and sidecar writes. PIL releases the GIL in
+# zlib, so encodes run in parallel; sized for a full /generate batch (<= 4)
+# and kept separate from the event loop's default executor.
+image_io_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="image-io")
+
+# Encode buffers are reused across images so the BytesIO backing store is
+# already sized for the next PNG; bounded so idle memory stays small.
+_BUFFER_POOL_SIZE = 4
+_buffer_pool: "queue.Queue[io.BytesIO]" = queue.Queue(maxsize=_BUFFER_POOL_SIZE)
+
+
+@contextmanager
+def _pooled_buffer() -> Iterator[io.BytesIO]:
+    """Borrow an empty BytesIO from the pool, returning it afterwards."""
+    try:
+        buf = _buffer_pool.get_nowait()
+    except queue.Empty:
+        buf = io.BytesIO()
+    buf.seek(0)
+    buf.truncate()
+    try:
+        yield buf
+    finally:
+        try:
+            _buffer_pool.put_nowait(buf)
+        except queue.Full:
+            pass
+
+
+def save_png(image: Image.Image, path: Path | str) -> None:
+    """Save an image as PNG using fast compression settings.
+
+    Encodes into a pooled in-memory buffer and writes the file in one call.
+    """
+    with _pooled_buffer() as buf:
+        image.save(buf, "PNG", compress_level=PNG_COMPRESS_LEVEL, optimize=False)
+        with buf.getbuffer() as view:
+            write_bytes(path, view)
+
+
+def encode_png(image: Image.Image) -> bytes:
+    """Encode an image to PNG bytes in memory using the same fast settings."""
+    with _pooled_buffer() as buf:
+        image.save(buf, "PNG", compress_level=PNG_COMPRESS_LEVEL, optimize=False)
+        return buf.getvalue()
+
+
+def save_image_asset(image: Image.Image, image_path: Path, metadata: dict, metadata_path: Path) -> None:
+    """Write a generated PNG and its metadata JSON sidecar.
+
+    Blocking; callers on the event loop or the GPU worker run it in a thread.
+    """
+    save_png(image, image_path)
+    write_json(metadata_path, metadata)
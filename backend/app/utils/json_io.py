@@ -0,0 +1,18 @@
+"""JSON file helpers backed by orjson."""
+
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from .files import write_bytes
+
+
+def json_bytes(data: Any, indent: bool = True) -> bytes:
+    """Serialize data to JSON bytes with orjson."""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+
+
+def write_json(path: Path | str, data: Any, indent: bool = True) -> None:
+    """Serialize data with orjson and write it in a single call."""
+    write_bytes(path, json_bytes(data, indent=indent))
@@ -3,18 +3,20 @@
 from pathlib import Path
 
 # Project root is 4 levels up from this file (utils -> app -> backend -> HollyWool)
-_PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+_PROJECT_ROOT = Path(__file__).parents[3]
+
+# Resolved and created once at import; the getters just return the cached Paths
+_OUTPUT_DIR = _PROJECT_ROOT / "outputs"
+_DATA_DIR = _PROJECT_ROOT / "data"
+_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+_DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
 def get_output_dir() -> Path:
-    """Get the outputs directory, creating it if it doesn't exist."""
-    output_dir = _PROJECT_ROOT / "outputs"
-    output_dir.mkdir(parents=True, exist_ok=True)
-    return output_dir
+    """Get the outputs directory."""
+    return _OUTPUT_DIR
 
 
 def get_data_dir() -> Path:
-    """Get the data directory, creating it if it doesn't exist."""
-    data_dir = _PROJECT_ROOT / "data"
-    data_dir.mkdir(parents=True, exist_ok=True)
-    return data_dir
+    """Get the data directory."""
+    return _DATA_DIR